@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+from src.audio.capture import CaptureService
+from src.utils.logger import setup_logger
+from src.vad.base import BaseVAD
+from src.vad.webrtc_vad import WebRTCVAD
+
+logger = setup_logger(__name__)
+
+
+class BargeInMonitor:
+    """Watch the microphone while the assistant speaks and fire on user speech.
+
+    Runs ``vad`` (default: WebRTC at aggressiveness 3) on 30 ms frames read
+    from the shared capture ring in a background thread. Once
+    ``min_speech_ms`` of consecutive speech is heard, the callback is invoked
+    and the capture position of the speech onset is kept, so
+    ``AudioRecorder.record_with_vad`` can resume from it without losing the
+    start of the interrupting utterance.
+    """
+
+    def __init__(self, capture: CaptureService, vad: BaseVAD | None = None,
+                 frame_duration_ms: int = 30, min_speech_ms: int = 90):
+        self._capture = capture
+        self._vad = vad or WebRTCVAD(capture.sample_rate, aggressiveness=3)
+        self._frame_size = int(capture.sample_rate * frame_duration_ms / 1000)
+        self._min_speech_frames = max(1, min_speech_ms // frame_duration_ms)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.onset_position: int | None = None
+
+    @property
+    def triggered(self) -> bool:
+        return self.onset_position is not None
+
+    def start(self, on_barge_in: Callable[[], None]):
+        self._stop_event.clear()
+        self.onset_position = None
+        self._thread = threading.Thread(target=self._run, args=(on_barge_in,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> int | None:
+        """Stop monitoring and return the capture position where barge-in speech began."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        return self.onset_position
+
+    def _run(self, on_barge_in: Callable[[], None]):
+        self._vad.reset()
+        cursor = self._capture.cursor(name="barge_in")
+        speech_frames = 0
+
+        while not self._stop_event.is_set():
+            data = cursor.read(self._frame_size, timeout=0.1)
+            if data is None:
+                continue
+
+            if self._vad.is_speech(data):
+                speech_frames += 1
+            else:
+                speech_frames = 0
+
+            if speech_frames == self._min_speech_frames:
+                logger.info("Barge-in detected, interrupting playback.")
+                self.onset_position = cursor.position - speech_frames * self._frame_size
+                on_barge_in()
+                break
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.audio.stream_stats import StreamStats
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from src.audio.sources import AudioSource
+
+logger = setup_logger(__name__)
+
+
+class CaptureService:
+    """Single always-running audio capture shared by every audio consumer.
+
+    One ``AudioSource`` (the microphone by default, or a file replay) feeds a
+    preallocated int16 ring for the life of the process: each buffer is
+    copied in and then the new write position is published. The source is
+    the only writer, so neither side locks the sample data: readers copy,
+    then check that the writer has not lapped them. The condition variable
+    only wakes blocked readers (and a replay source waiting for demand), and
+    the writer never blocks on it: when a reader holds its lock, that wake-up
+    is skipped, and waiting readers re-check every chunk period anyway.
+
+    Positions are absolute sample counts since start, so consumers (wake word,
+    VAD recorder, barge-in) each read through their own ``CaptureCursor`` on
+    their own thread, and slow processing there (e.g. during Whisper inference)
+    never stalls the PortAudio callback.
+
+    Sources always deliver ``sample_rate`` audio. ``device_rate`` is passed to
+    the default microphone source, which opens the device at that rate and
+    resamples.
+    """
+
+    def __init__(self, sample_rate: int = 16000, channels: int = 1,
+                 chunk_size: int = 1024, buffer_seconds: float = 30.0,
+                 device_rate: int = 0, source: AudioSource | None = None):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.chunk_size = chunk_size
+        if source is None:
+            from src.audio.mic_source import MicrophoneSource
+            source = MicrophoneSource(sample_rate, channels, chunk_size, device_rate)
+        self._source = source
+        self._capacity = int(sample_rate * channels * buffer_seconds)
+        # The writer may be filling one chunk past the published position, so
+        # the oldest chunk in the ring is treated as already overwritten. A
+        # resampled chunk can come out a sample or two longer than chunk_size.
+        self._retained = self._capacity - (chunk_size + 2) * channels
+        self._ring = np.zeros(self._capacity, dtype=np.int16)
+        self._written = 0
+        self._cond = threading.Condition()
+        self._running = False
+        self._demand = 0  # furthest position a blocked reader has asked for
+        # Longest a waiting reader sleeps between checks if a wake-up is skipped.
+        self._poll = chunk_size / sample_rate
+        self._last_callback: float | None = None
+        # "capture" is the source side; readers get one entry per cursor name.
+        self._stats: dict[str, StreamStats] = {
+            "capture": StreamStats("capture", source.native_rate, continuous=True)
+        }
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def position(self) -> int:
+        """Total number of samples captured so far."""
+        return self._written
+
+    def stats(self) -> dict[str, dict]:
+        """Snapshot of the capture stream and every named reader."""
+        return {name: stats.snapshot() for name, stats in list(self._stats.items())}
+
+    def reader_stats(self, name: str) -> StreamStats:
+        if name not in self._stats:
+            self._stats[name] = StreamStats(name, self.sample_rate)
+        return self._stats[name]
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._source.start(self)
+
+    def cursor(self, position: int | None = None, name: str = "reader") -> CaptureCursor:
+        """Create a reader starting at position (default: live).
+
+        Cursors sharing a name (e.g. one per VAD recording) share counters.
+        """
+        return CaptureCursor(self, self._written if position is None else position,
+                             self.reader_stats(name))
+
+    def close(self):
+        self.end()
+        self._source.stop()
+        lost = {name: (s.overflows, s.dropped) for name, s in self._stats.items()
+                if s.overflows or s.dropped}
+        if lost:
+            logger.warning(f"Capture lost audio this session (overflows, dropped samples): {lost}")
+
+    def end(self):
+        """Stop accepting audio; readers drain what is buffered and then stop.
+
+        Called by ``close`` and by sources that run out of audio.
+        """
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+
+    def push(self, samples: np.ndarray, frames: int, short: bool = False,
+             overflow: bool = False, underflow: bool = False):
+        """Append one source buffer (at sample_rate) and count it in the
+        capture stats. ``frames`` is the buffer length at the source's own rate."""
+        stats = self._stats["capture"]
+        now = time.monotonic()
+        if self._last_callback is not None:
+            stats.latency.record((now - self._last_callback) * 1000)
+        self._last_callback = now
+        if overflow:
+            stats.overflows += 1
+        if underflow:
+            stats.underflows += 1
+        if short:
+            stats.short_reads += 1
+        stats.samples += frames
+        self._write(samples)
+
+    def wait_for_demand(self, timeout: float | None = None) -> bool:
+        """Block until a reader is waiting for audio not yet captured.
+
+        Lets an as-fast-as-possible replay source run exactly as fast as its
+        consumers and pause while they are busy (e.g. during STT), instead of
+        lapping them.
+        """
+        with self._cond:
+            ready = self._cond.wait_for(
+                lambda: self._demand > self._written or not self._running, timeout
+            )
+        return ready and self._running
+
+    def _write(self, samples: np.ndarray):
+        start = self._written % self._capacity
+        first = min(len(samples), self._capacity - start)
+        self._ring[start:start + first] = samples[:first]
+        self._ring[:len(samples) - first] = samples[first:]
+        # Publish only once the samples are in place.
+        self._written += len(samples)
+        # Never block the audio callback on a reader holding the lock.
+        if self._cond.acquire(blocking=False):
+            try:
+                self._cond.notify_all()
+            finally:
+                self._cond.release()
+
+    def _wait(self, position: int, timeout: float | None) -> bool:
+        """Block until the ring holds samples up to position."""
+        if self._written >= position:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if position > self._demand:
+                self._demand = position
+                self._cond.notify_all()
+            # Poll as well as wait: the writer skips wake-ups it cannot deliver
+            # without blocking.
+            while self._written < position and self._running:
+                wait = self._poll
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        break
+                self._cond.wait(wait)
+            return self._written >= position
+
+    def _copy_into(self, position: int, out: np.ndarray) -> int:
+        """Copy len(out) samples from position into out, clamped to the oldest
+        retained sample. Returns the position actually read from."""
+        count = len(out)
+        while True:
+            position = max(position, self._written - self._retained)
+            start = position % self._capacity
+            first = min(count, self._capacity - start)
+            out[:first] = self._ring[start:start + first]
+            out[first:] = self._ring[:count - first]
+            # If the writer lapped us mid-copy, retry from the new oldest sample.
+            if self._written - position <= self._retained:
+                return position
+
+
+class CaptureCursor:
+    """Independent read position into a CaptureService ring buffer."""
+
+    def __init__(self, service: CaptureService, position: int, stats: StreamStats):
+        self._service = service
+        self.position = position
+        self.dropped = 0
+        self._stats = stats
+
+    @property
+    def available(self) -> int:
+        return self._service.position - self.position
+
+    def read(self, count: int, timeout: float | None = None) -> np.ndarray | None:
+        """Return the next count samples, blocking until they are captured.
+
+        Returns None on timeout or once capture has stopped.
+        """
+        out = np.empty(count, dtype=np.int16)
+        return out if self.read_into(out, timeout) else None
+
+    def read_into(self, out: np.ndarray, timeout: float | None = None) -> bool:
+        """Fill out with the next len(out) samples, blocking until captured.
+
+        Returns False on timeout or once capture has stopped. A reader that fell
+        more than a ring's worth behind skips ahead to the oldest retained audio
+        and the skipped samples are counted as dropped.
+        """
+        start = time.monotonic()
+        ready = self._service._wait(self.position + len(out), timeout)
+        self._stats.latency.record((time.monotonic() - start) * 1000)
+        if not ready:
+            if self._service.running:
+                self._stats.timeouts += 1
+            return False
+        position = self._service._copy_into(self.position, out)
+        if position > self.position:
+            skipped = position - self.position
+            self.dropped += skipped
+            self._stats.dropped += skipped
+            logger.warning(f"Capture reader '{self._stats.name}' fell behind; skipped {skipped} samples.")
+        self.position = position + len(out)
+        self._stats.samples += len(out)
+        return True
+
+    def seek_to_live(self):
+        self.position = self._service.position
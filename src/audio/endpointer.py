@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def frame_dbfs(frame: np.ndarray) -> float:
+    """RMS level of an int16 frame in dBFS."""
+    rms = np.sqrt(np.mean(np.square(frame, dtype=np.float64))) if len(frame) else 0.0
+    return 20 * np.log10(max(rms, 1.0) / 32768.0)
+
+
+class Endpointer:
+    """Decide when an utterance has ended from per-frame VAD decisions.
+
+    With ``adaptive=False`` this is the classic fixed trailing-silence rule.
+    In adaptive mode the trailing-silence window moves between
+    ``min_silence`` and ``max_silence``:
+
+    * short utterances (under ``short_utterance``) get a window scaled down
+      towards ``min_silence``, since "what time is it" is obviously complete;
+    * pauses the speaker has already made and then resumed from mark them as
+      a hesitant speaker, and the window grows to 1.5x the longest such pause;
+    * non-speech frames well above the tracked noise floor (breaths, "umm",
+      trailing consonants) count as half a silent frame.
+
+    The noise floor is an asymmetric moving average of frame energy over
+    non-speech frames: it falls quickly and rises slowly.
+    """
+
+    def __init__(self, frame_duration_ms: int = 30, silence_timeout: float = 1.0,
+                 min_silence: float = 0.5, max_silence: float = 2.0,
+                 adaptive: bool = True, short_utterance: float = 1.5,
+                 hesitation_margin_db: float = 10.0):
+        self._frame_s = frame_duration_ms / 1000
+        self._silence_timeout = silence_timeout
+        self._min_silence = min(min_silence, silence_timeout)
+        self._max_silence = max(max_silence, silence_timeout)
+        self._adaptive = adaptive
+        self._short_utterance = short_utterance
+        self._hesitation_margin_db = hesitation_margin_db
+        self.noise_floor_db = -60.0
+        self.reset()
+
+    def reset(self):
+        self._speech_s = 0.0
+        self._silence_s = 0.0
+        self._longest_pause_s = 0.0
+
+    @property
+    def window(self) -> float:
+        """Trailing silence (seconds) currently required to end the utterance."""
+        if not self._adaptive:
+            return self._silence_timeout
+        window = self._silence_timeout
+        if self._speech_s < self._short_utterance:
+            fraction = self._speech_s / self._short_utterance
+            window = self._min_silence + (self._silence_timeout - self._min_silence) * fraction
+        if self._longest_pause_s:
+            window = max(window, 1.5 * self._longest_pause_s)
+        return min(max(window, self._min_silence), self._max_silence)
+
+    def update(self, is_speech: bool, frame: np.ndarray | None = None) -> bool:
+        """Feed one frame after speech has started. Returns True at the endpoint."""
+        if is_speech:
+            if self._silence_s:
+                self._longest_pause_s = max(self._longest_pause_s, self._silence_s)
+            self._silence_s = 0.0
+            self._speech_s += self._frame_s
+            return False
+
+        weight = 1.0
+        if self._adaptive and frame is not None:
+            level = frame_dbfs(frame)
+            if level > self.noise_floor_db + self._hesitation_margin_db:
+                weight = 0.5
+            self.observe_noise(level)
+        self._silence_s += weight * self._frame_s
+        return self._silence_s >= self.window
+
+    def observe_noise(self, level_db: float):
+        """Update the noise floor from a frame VAD classified as non-speech."""
+        rate = 0.3 if level_db < self.noise_floor_db else 0.02
+        self.noise_floor_db += rate * (level_db - self.noise_floor_db)
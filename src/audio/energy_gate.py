@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+def frame_features(frame: np.ndarray) -> tuple[float, float]:
+    """RMS level in dBFS and zero-crossing rate (crossings per sample) of an int16 frame."""
+    if len(frame) < 2:
+        return -96.0, 0.0
+    samples = frame.astype(np.float32)
+    rms = math.sqrt(float(np.dot(samples, samples)) / len(samples))
+    signs = np.signbit(frame)
+    zcr = np.count_nonzero(signs[1:] != signs[:-1]) / (len(frame) - 1)
+    return 20 * math.log10(max(rms, 1.0) / 32768.0), zcr
+
+
+class EnergyGate:
+    """Cheap silence gate run before an expensive detector (webrtcvad, wake word).
+
+    A frame is clearly silent when its level is within ``margin_db`` of the
+    tracked noise floor. Quiet fricatives ("s", "f") are let through by their
+    zero-crossing rate when they sit at least half the margin above the floor.
+    After any open frame the gate stays open for ``hangover_ms`` so word onsets
+    and tails still reach the detector, and while closed it still lets one
+    frame through every ``probe_interval_ms`` in case the floor has drifted
+    up over sustained speech.
+
+    The noise floor starts at ``initial_floor_db`` (as in ``Endpointer``)
+    rather than the first frame, which is often speech right after the wake
+    word. It is a minimum-tracking average: it falls within about 0.1 s and
+    rises with a 5 s time constant, independent of frame length, so a quiet
+    room pulls it down almost at once and a noisy one keeps the gate open
+    until it has caught up.
+    """
+
+    def __init__(self, frame_duration_ms: int = 30, margin_db: float = 8.0,
+                 hangover_ms: int = 300, probe_interval_ms: int = 1000,
+                 zcr_threshold: float = 0.3, enabled: bool = True,
+                 initial_floor_db: float = -60.0):
+        frame_s = frame_duration_ms / 1000
+        self._fall = 1 - math.exp(-frame_s / 0.1)
+        self._rise = 1 - math.exp(-frame_s / 5.0)
+        self._margin_db = margin_db
+        self._hangover_frames = max(1, math.ceil(hangover_ms / frame_duration_ms))
+        self._probe_frames = max(1, round(probe_interval_ms / frame_duration_ms)) if probe_interval_ms else 0
+        self._zcr_threshold = zcr_threshold
+        self._enabled = enabled
+        self.noise_floor_db = initial_floor_db
+        self._open_frames = 0
+        self._closed_run = 0
+        self.frames = 0
+        self.skipped = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        return self.skipped / self.frames if self.frames else 0.0
+
+    def is_silent(self, frame: np.ndarray) -> bool:
+        """True when the detector can skip this frame and treat it as non-speech."""
+        self.frames += 1
+        if not self._enabled:
+            return False
+
+        level, zcr = frame_features(frame)
+        above = level - self.noise_floor_db
+        rate = self._fall if above < 0 else self._rise
+        self.noise_floor_db += rate * above
+
+        if above >= self._margin_db or (zcr >= self._zcr_threshold and above >= self._margin_db / 2):
+            self._open_frames = self._hangover_frames
+        if self._open_frames:
+            self._open_frames -= 1
+            self._closed_run = 0
+            return False
+
+        self._closed_run += 1
+        if self._probe_frames and self._closed_run % self._probe_frames == 0:
+            return False
+        self.skipped += 1
+        return True
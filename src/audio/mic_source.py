@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyaudio
+
+from src.audio.resampler import Resampler
+from src.audio.sources import AudioSource
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from src.audio.capture import CaptureService
+
+logger = setup_logger(__name__)
+
+
+class MicrophoneSource(AudioSource):
+    """PyAudio input stream whose callback pushes straight into the ring.
+
+    With ``device_rate`` set, the device is opened at that rate (typically its
+    native 44.1 or 48 kHz, avoiding driver resampling) and each buffer is
+    resampled to ``sample_rate`` in the callback. Mono only.
+    """
+
+    def __init__(self, sample_rate: int = 16000, channels: int = 1,
+                 chunk_size: int = 1024, device_rate: int = 0):
+        self.native_rate = device_rate or sample_rate
+        self._sample_rate = sample_rate
+        self._channels = channels
+        self._resampler: Resampler | None = None
+        self._chunk = chunk_size
+        if self.native_rate != sample_rate:
+            if channels != 1:
+                raise ValueError("Capture resampling supports mono input only")
+            self._resampler = Resampler(self.native_rate, sample_rate)
+            # Same callback period as chunk_size at the ring's rate.
+            self._chunk = round(chunk_size * self.native_rate / sample_rate)
+        self._capture: CaptureService | None = None
+        self._stream = None
+        self._pa = pyaudio.PyAudio()
+
+    def start(self, capture: CaptureService) -> None:
+        self._capture = capture
+        self._stream = self._pa.open(
+            format=pyaudio.paInt16,
+            channels=self._channels,
+            rate=self.native_rate,
+            input=True,
+            frames_per_buffer=self._chunk,
+            stream_callback=self._on_audio,
+        )
+        self._stream.start_stream()
+        if self._resampler:
+            logger.info(f"Microphone capture started ({self.native_rate} Hz, "
+                        f"resampled to {self._sample_rate} Hz).")
+        else:
+            logger.info(f"Microphone capture started ({self._sample_rate} Hz).")
+
+    def stop(self) -> None:
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        self._pa.terminate()
+
+    def _on_audio(self, in_data, frame_count, time_info, status_flags):
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        if self._resampler:
+            samples = self._resampler.process(samples)
+        self._capture.push(
+            samples, frame_count,
+            short=frame_count < self._chunk,
+            overflow=bool(status_flags & pyaudio.paInputOverflow),
+            underflow=bool(status_flags & pyaudio.paInputUnderflow),
+        )
+        return None, pyaudio.paContinue if self._capture.running else pyaudio.paComplete
@@ -1,31 +1,200 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import Iterator
 
 import numpy as np
 import sounddevice as sd
 
+from src.audio.resampler import Resampler
+from src.audio.stream_stats import StreamStats
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+class _JitterBuffer:
+    """Bounded int16 FIFO between the producer thread and the audio callback."""
+
+    def __init__(self, capacity: int):
+        self._data = np.zeros(capacity, dtype=np.int16)
+        self._capacity = capacity
+        self._read = 0   # absolute sample counters; index = counter % capacity
+        self._write = 0
+        self._discarding = False
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    @property
+    def discarding(self) -> bool:
+        return self._discarding
+
+    def write(self, samples: np.ndarray) -> None:
+        """Append samples, blocking while the buffer is full. Dropped after clear()."""
+        offset = 0
+        while offset < len(samples):
+            with self._cond:
+                while self._write - self._read >= self._capacity and not self._discarding:
+                    self._cond.wait()
+                if self._discarding:
+                    return
+                count = min(len(samples) - offset,
+                            self._capacity - (self._write - self._read))
+                self._copy_in(samples[offset:offset + count])
+                self._write += count
+            offset += count
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy up to len(out) samples into out without blocking."""
+        with self._cond:
+            count = min(len(out), self._write - self._read)
+            start = self._read % self._capacity
+            first = min(count, self._capacity - start)
+            out[:first] = self._data[start:start + first]
+            out[first:count] = self._data[:count - first]
+            self._read += count
+            self._cond.notify_all()
+        return count
+
+    def wait_empty(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._write == self._read, timeout)
+
+    def clear(self) -> None:
+        """Drop queued audio and discard further writes until reset()."""
+        with self._cond:
+            self._read = self._write
+            self._discarding = True
+            self._cond.notify_all()
+
+    def reset(self) -> None:
+        with self._cond:
+            self._discarding = False
+
+    def _copy_in(self, samples: np.ndarray) -> None:
+        start = self._write % self._capacity
+        first = min(len(samples), self._capacity - start)
+        self._data[start:start + first] = samples[:first]
+        self._data[:len(samples) - first] = samples[first:]
+
+
 class AudioPlayer:
+    """Speaker output through a persistent OutputStream.
+
+    The device stays open across turns and is only reopened when the sample
+    rate changes. Chunks are written to a bounded jitter buffer that the
+    PortAudio callback drains; playback starts once ``prebuffer_ms`` of audio
+    is queued (or the stream ends), and every callback that finds the buffer
+    empty mid-stream is counted as an underrun (``stats.underruns``).
+    Device-reported output underflows go to ``stats.underflows``.
+
+    With ``device_rate`` set the stream is opened once at that rate and every
+    source (Piper voices, prompts) is resampled to it before queueing, instead
+    of reopening the device per rate and leaving conversion to the driver.
+    """
+
+    def __init__(self, buffer_seconds: float = 2.0, prebuffer_ms: int = 100,
+                 device_rate: int = 0):
+        self._buffer_seconds = buffer_seconds
+        self._prebuffer_ms = prebuffer_ms
+        self._device_rate = device_rate
+        self._stream: sd.OutputStream | None = None
+        self._buffer: _JitterBuffer | None = None
+        self._sample_rate = 0
+        self._prebuffer = 0
+        self._primed = False
+        self._draining = False
+        self._last_callback: float | None = None
+        self.stats = StreamStats("playback", 0, continuous=True)
+        self.first_audio_time: float | None = None  # monotonic, set per play_stream
+
     def play(self, audio: np.ndarray, sample_rate: int):
         """Play an audio array (int16 or float32) and block until done."""
-        if audio.dtype == np.int16:
-            audio = audio.astype(np.float32) / 32768.0
-        sd.play(audio, samplerate=sample_rate)
-        sd.wait()
+        if audio.dtype != np.int16:
+            audio = (audio * 32768.0).clip(-32768, 32767).astype(np.int16)
+        self.play_stream(iter([audio]), sample_rate)
 
     def play_stream(self, chunks: Iterator[bytes], sample_rate: int):
-        """Play streaming int16 audio chunks."""
-        buffer: list[bytes] = []
+        """Play streaming int16 audio chunks as they arrive, blocking until done."""
+        self._ensure_stream(self._device_rate or sample_rate)
+        resampler = Resampler(sample_rate, self._sample_rate)
+        self._buffer.reset()
+        self.first_audio_time = None
+        self._primed = False
+        self._draining = False
+        underruns_before = self.stats.underruns
+
         for chunk in chunks:
-            buffer.append(chunk)
+            samples = chunk if isinstance(chunk, np.ndarray) else np.frombuffer(chunk, dtype=np.int16)
+            self._buffer.write(resampler.process(samples))
+            if self._buffer.discarding:
+                break
+        else:
+            self._buffer.write(resampler.flush())
+
+        self._draining = True
+        self._primed = True
+        self._buffer.wait_empty()
+        # Let the device play out what PortAudio has already pulled.
+        sd.sleep(int(self._stream.latency * 1000))
 
-        if not buffer:
+        underruns = self.stats.underruns - underruns_before
+        if underruns:
+            logger.warning(f"Playback underran {underruns} time(s); audio arrived slower than real time.")
+
+    def stop(self):
+        """Discard queued and incoming audio so the current play_stream returns promptly."""
+        if self._buffer is not None:
+            self._buffer.clear()
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+    def _ensure_stream(self, sample_rate: int):
+        if self._stream is not None and self._sample_rate == sample_rate:
             return
+        self.close()
+        self._sample_rate = sample_rate
+        # Rate is measured per open stream; idle time before opening is not loss.
+        self.stats.restart_rate(sample_rate)
+        self._last_callback = None
+        self._prebuffer = int(sample_rate * self._prebuffer_ms / 1000)
+        self._buffer = _JitterBuffer(int(sample_rate * self._buffer_seconds))
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype="int16",
+            callback=self._callback,
+        )
+        self._stream.start()
+        logger.info(f"Opened output stream at {sample_rate} Hz.")
+
+    def _callback(self, outdata: np.ndarray, frames: int, time_info, status):
+        now = time.monotonic()
+        if self._last_callback is not None:
+            self.stats.latency.record((now - self._last_callback) * 1000)
+        self._last_callback = now
+        self.stats.samples += frames
+        if status.output_underflow:
+            self.stats.underflows += 1
+
+        out = outdata[:, 0]
+        if not self._primed:
+            if len(self._buffer) < self._prebuffer:
+                out[:] = 0
+                return
+            self._primed = True
 
-        audio = np.frombuffer(b"".join(buffer), dtype=np.int16)
-        self.play(audio, sample_rate)
+        copied = self._buffer.read_into(out)
+        if copied and self.first_audio_time is None:
+            self.first_audio_time = time.monotonic()
+        if copied < frames:
+            out[copied:] = 0
+            if not self._draining:
+                self.stats.underruns += 1
@@ -3,42 +3,52 @@ from __future__ import annotations
 import threading
 
 import numpy as np
-import pyaudio
-import webrtcvad
 
+from src.audio.capture import CaptureService
+from src.audio.endpointer import Endpointer, frame_dbfs
+from src.audio.energy_gate import EnergyGate
+from src.audio.sample_buffer import SampleBuffer
+from src.audio.sources import AudioSource
+from src.audio.spill_buffer import SpillBuffer
+from src.stt.streaming import StreamingTranscriber
 from src.utils.logger import setup_logger
+from src.utils.tracing import TurnTrace
+from src.vad.base import BaseVAD
+from src.vad.webrtc_vad import WebRTCVAD
 
 logger = setup_logger(__name__)
 
 
 class AudioRecorder:
     def __init__(self, sample_rate: int = 16000, channels: int = 1,
-                 chunk_size: int = 1024):
+                 chunk_size: int = 1024, capture: CaptureService | None = None,
+                 device_rate: int = 0, source: AudioSource | None = None):
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
-        self._pa = pyaudio.PyAudio()
-
-    def record_until_enter(self) -> np.ndarray:
-        """Record audio until the user presses Enter. Returns int16 ndarray."""
-        stream = self._pa.open(
-            format=pyaudio.paInt16,
-            channels=self.channels,
-            rate=self.sample_rate,
-            input=True,
-            frames_per_buffer=self.chunk_size,
-        )
-
-        frames: list[bytes] = []
+        self._owns_capture = capture is None
+        self.capture = capture or CaptureService(sample_rate, channels, chunk_size,
+                                                 device_rate=device_rate, source=source)
+        self.capture.start()
+
+    def record_until_enter(self, spill_to_disk: bool = False, spill_dir: str = "") -> np.ndarray:
+        """Record audio until the user presses Enter. Returns int16 ndarray.
+
+        With spill_to_disk the recording streams into a temporary file in
+        one-minute segments and a read-only np.memmap is returned, so memory
+        stays flat for dictation of any length.
+        """
+        cursor = self.capture.cursor(name="push_to_talk")
+        if spill_to_disk:
+            buffer = SpillBuffer(self.sample_rate * 60, spill_dir)
+        else:
+            buffer = SampleBuffer(self.sample_rate * 30)
         stop_event = threading.Event()
 
         def _capture():
             while not stop_event.is_set():
-                try:
-                    data = stream.read(self.chunk_size, exception_on_overflow=False)
-                    frames.append(data)
-                except OSError:
-                    break
+                if cursor.read_into(buffer.reserve(self.chunk_size), timeout=0.1):
+                    buffer.commit(self.chunk_size)
 
         thread = threading.Thread(target=_capture, daemon=True)
         thread.start()
@@ -48,85 +58,112 @@ class AudioRecorder:
         stop_event.set()
         thread.join(timeout=1.0)
 
-        stream.stop_stream()
-        stream.close()
+        # Pick up the partial chunk captured before Enter was pressed.
+        tail = cursor.available
+        if tail > 0 and cursor.read_into(buffer.reserve(tail), timeout=0):
+            buffer.commit(tail)
 
-        if not frames:
-            return np.array([], dtype=np.int16)
-
-        audio = np.frombuffer(b"".join(frames), dtype=np.int16)
-        duration = len(audio) / self.sample_rate
-        logger.info(f"Recorded {duration:.1f}s of audio.")
+        audio = buffer.view()
+        if spill_to_disk:
+            buffer.close()
+        if len(audio):
+            logger.info(f"Recorded {len(audio) / self.sample_rate:.1f}s of audio.")
         return audio
 
-    def record_with_vad(self, aggressiveness: int = 2,
+    def record_with_vad(self, vad: BaseVAD | None = None,
                         silence_timeout: float = 1.0,
                         frame_duration_ms: int = 30,
-                        listen_timeout: float = 0) -> np.ndarray:
+                        listen_timeout: float = 0,
+                        start_position: int | None = None,
+                        trace: TurnTrace | None = None,
+                        endpointer: Endpointer | None = None,
+                        gate: EnergyGate | None = None,
+                        streamer: StreamingTranscriber | None = None) -> np.ndarray:
         """Record audio using VAD, stopping after silence_timeout seconds of silence.
 
         Args:
+            vad: Speech detector, reset at the start of each call. Defaults to
+                webrtcvad at aggressiveness 2.
             listen_timeout: Max seconds to wait for speech to start. 0 = no limit.
+            start_position: Capture position to start reading from (e.g. a
+                barge-in onset). Defaults to live audio.
+            trace: Receives the speech_onset and endpoint marks.
+            endpointer: Decides the end of speech (e.g. adaptively). Defaults
+                to a fixed silence_timeout. Reset at the start of each call, so
+                its noise floor carries over between recordings.
+            gate: Energy gate; frames it calls silent skip the VAD and count
+                as non-speech.
+            streamer: Started at speech onset and fed every recorded frame, so
+                the utterance is transcribed while it is spoken. Call its
+                ``finish`` with the returned audio for the transcript.
         """
-        vad = webrtcvad.Vad(aggressiveness)
+        if vad is None:
+            vad = WebRTCVAD(self.sample_rate)
+        vad.reset()
         frame_size = int(self.sample_rate * frame_duration_ms / 1000)  # samples per frame
-        frame_bytes = frame_size * 2  # int16 = 2 bytes per sample
+        cursor = self.capture.cursor(start_position, name="vad")
 
-        stream = self._pa.open(
-            format=pyaudio.paInt16,
-            channels=self.channels,
-            rate=self.sample_rate,
-            input=True,
-            frames_per_buffer=frame_size,
-        )
+        if endpointer is None:
+            endpointer = Endpointer(frame_duration_ms, silence_timeout, adaptive=False)
+        endpointer.reset()
 
-        frames: list[bytes] = []
+        buffer = SampleBuffer(self.sample_rate * 10)
         speech_started = False
-        silent_frames = 0
         waiting_frames = 0
-        max_silent_frames = int(silence_timeout * 1000 / frame_duration_ms)
         max_waiting_frames = int(listen_timeout * 1000 / frame_duration_ms) if listen_timeout > 0 else 0
 
         logger.info("Listening for speech...")
 
         try:
             while True:
-                data = stream.read(frame_size, exception_on_overflow=False)
-                if len(data) < frame_bytes:
+                # Read straight into the next slot; it is only committed once
+                # we know the frame belongs to the recording.
+                frame = buffer.reserve(frame_size)
+                if not cursor.read_into(frame, timeout=1.0):
+                    if not self.capture.running:
+                        break
                     continue
 
-                is_speech = vad.is_speech(data[:frame_bytes], self.sample_rate)
-
-                if is_speech:
-                    if not speech_started:
-                        speech_started = True
-                        logger.info("Speech detected, recording...")
-                    silent_frames = 0
-                    frames.append(data)
-                elif speech_started:
-                    frames.append(data)
-                    silent_frames += 1
-                    if silent_frames >= max_silent_frames:
-                        logger.info("Silence detected, stopping recording.")
+                if gate is not None and gate.is_silent(frame):
+                    is_speech = False
+                else:
+                    is_speech = vad.is_speech(frame)
+
+                if is_speech and not speech_started:
+                    speech_started = True
+                    logger.info("Speech detected, recording...")
+                    if trace:
+                        trace.mark("speech_onset")
+                    if streamer:
+                        streamer.start(buffer)
+
+                if speech_started:
+                    buffer.commit(frame_size)
+                    if streamer:
+                        streamer.observe(len(buffer), is_speech)
+                    if endpointer.update(is_speech, frame):
+                        logger.info(f"Silence detected ({endpointer.window:.2f}s window), "
+                                    "stopping recording.")
+                        if trace:
+                            trace.mark("endpoint")
                         break
                 else:
+                    endpointer.observe_noise(frame_dbfs(frame))
                     waiting_frames += 1
                     if max_waiting_frames > 0 and waiting_frames >= max_waiting_frames:
                         logger.info("No speech detected within listen timeout.")
                         break
         except KeyboardInterrupt:
             pass
-        finally:
-            stream.stop_stream()
-            stream.close()
 
-        if not frames:
-            return np.array([], dtype=np.int16)
+        if gate is not None and gate.frames:
+            logger.debug(f"Energy gate skipped {gate.skip_ratio:.0%} of VAD frames so far.")
 
-        audio = np.frombuffer(b"".join(frames), dtype=np.int16)
-        duration = len(audio) / self.sample_rate
-        logger.info(f"Recorded {duration:.1f}s of audio.")
+        audio = buffer.view()
+        if len(audio):
+            logger.info(f"Recorded {len(audio) / self.sample_rate:.1f}s of audio.")
         return audio
 
     def close(self):
-        self._pa.terminate()
+        if self._owns_capture:
+            self.capture.close()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@lru_cache(maxsize=16)
+def _polyphase_taps(up: int, down: int, zero_crossings: int, rolloff: float) -> np.ndarray:
+    """Kaiser-windowed sinc low-pass split into ``up`` phases of equal length.
+
+    Row ``p`` holds taps ``p, p + up, p + 2*up, ...`` of the prototype, scaled
+    by ``up`` so unity gain survives the zero-stuffing. Column ``j`` multiplies
+    input sample ``base - j`` of the output being computed.
+    """
+    taps_per_phase = 2 * math.ceil(zero_crossings * max(up, down) / up)
+    length = taps_per_phase * up
+    cutoff = rolloff / max(up, down)  # as a fraction of the upsampled Nyquist rate
+    t = np.arange(length) - length // 2  # centred on the delay used by Resampler
+    prototype = cutoff * np.sinc(cutoff * t) * np.kaiser(length, 8.6)
+    prototype *= up / prototype.sum()
+    taps = prototype.reshape(taps_per_phase, up).T.astype(np.float32)
+    taps.flags.writeable = False
+    return taps
+
+
+class Resampler:
+    """Streaming rational-ratio polyphase resampler for mono audio.
+
+    ``process`` accepts chunks of any length and returns every output sample
+    that can be computed so far; call ``flush`` at the end of a stream to
+    get the tail still held back by the filter. Concatenated output matches a
+    one-shot conversion of the whole signal with the filter delay removed,
+    and has ``ceil(n * dst / src)`` samples for ``n`` input samples.
+
+    Only output samples are computed (no zero-stuffed intermediate signal),
+    vectorised with numpy half a second of output at a time. Filter taps are
+    cached per ratio, so creating one resampler per stream is cheap. int16
+    input gives int16 output; anything else is processed and returned as
+    float32.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int, zero_crossings: int = 16,
+                 rolloff: float = 0.94):
+        divisor = math.gcd(src_rate, dst_rate)
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self._up = dst_rate // divisor
+        self._down = src_rate // divisor
+        self._taps = _polyphase_taps(self._up, self._down, zero_crossings, rolloff)
+        self._width = self._taps.shape[1]
+        self._delay = self._taps.size // 2
+        self._block = max(1, dst_rate // 2)  # output samples computed per step
+        self.reset()
+
+    @property
+    def passthrough(self) -> bool:
+        return self._up == self._down
+
+    def reset(self):
+        # Input history, starting at absolute input index self._history_start.
+        self._history = np.zeros(self._width - 1, dtype=np.float32)
+        self._history_start = -(self._width - 1)
+        self._received = 0
+        self._emitted = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        if self.passthrough:
+            self._received += len(chunk)
+            self._emitted += len(chunk)
+            return chunk
+        out = self._run(chunk.astype(np.float32, copy=False))
+        return self._as_dtype(out, chunk.dtype)
+
+    def flush(self, dtype=np.int16) -> np.ndarray:
+        """Return the remaining output and reset for the next stream."""
+        if self.passthrough:
+            self.reset()
+            return np.zeros(0, dtype=dtype)
+        total = -(-self._received * self._up // self._down)
+        padding = np.zeros(self._delay // self._up + self._width, dtype=np.float32)
+        out = self._run(padding)[:total - self._emitted]
+        self.reset()
+        return self._as_dtype(out, np.dtype(dtype))
+
+    def _run(self, chunk: np.ndarray) -> np.ndarray:
+        self._received += len(chunk)
+        buffer = np.concatenate([self._history, chunk])
+
+        # Output k sits at upsampled index k*down + delay and needs input up to
+        # index base = that // up.
+        last = (self._received * self._up - 1 - self._delay) // self._down + 1
+        first, stop = self._emitted, max(last, self._emitted)
+        out = np.empty(stop - first, dtype=np.float32)
+        # Row r of the reversed windows is x[r + width - 1], x[r + width - 2], ...
+        windows = sliding_window_view(buffer, self._width)[:, ::-1]
+        # Gathering rows copies width samples per output, so go a block of
+        # output at a time to keep that bounded for long one-shot signals.
+        for block in range(first, stop, self._block):
+            ks = np.arange(block, min(block + self._block, stop), dtype=np.int64)
+            base, phase = np.divmod(ks * self._down + self._delay, self._up)
+            rows = windows[base - (self._width - 1) - self._history_start]
+            if self._up == 1:
+                out[block - first:block - first + len(ks)] = rows @ self._taps[0]
+            else:
+                out[block - first:block - first + len(ks)] = np.einsum(
+                    "kt,kt->k", rows, self._taps[phase])
+        self._emitted = stop
+
+        next_base = (self._emitted * self._down + self._delay) // self._up
+        keep_from = min(next_base - (self._width - 1), self._received - (self._width - 1))
+        self._history = buffer[keep_from - self._history_start:].copy()
+        self._history_start = keep_from
+        return out
+
+    @staticmethod
+    def _as_dtype(samples: np.ndarray, dtype: np.dtype) -> np.ndarray:
+        if dtype == np.int16:
+            return np.clip(np.rint(samples), -32768, 32767).astype(np.int16)
+        return samples
+
+
+def resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """One-shot conversion of a whole signal."""
+    if src_rate == dst_rate:
+        return audio
+    resampler = Resampler(src_rate, dst_rate)
+    head = resampler.process(audio)
+    return np.concatenate([head, resampler.flush(head.dtype)])
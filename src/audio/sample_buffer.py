@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class SampleBuffer:
+    """Growable, preallocated int16 buffer that capture writes into in place.
+
+    Callers ``reserve`` a slot, fill it (e.g. ``CaptureCursor.read_into``) and
+    ``commit`` it, or simply leave it uncommitted to drop the frame. Capacity
+    doubles when exhausted, so a recording costs O(log n) allocations instead
+    of one per chunk, and ``view()`` returns the samples without copying.
+    """
+
+    def __init__(self, initial_samples: int = 16000 * 10):
+        self._data = np.empty(max(1, initial_samples), dtype=np.int16)
+        self._length = 0
+        self.allocations = 1
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def reserve(self, count: int) -> np.ndarray:
+        """Return a writable slot for the next count samples."""
+        needed = self._length + count
+        if needed > len(self._data):
+            grown = np.empty(max(needed, 2 * len(self._data)), dtype=np.int16)
+            grown[:self._length] = self._data[:self._length]
+            self._data = grown
+            self.allocations += 1
+        return self._data[self._length:needed]
+
+    def commit(self, count: int):
+        """Keep the first count samples of the last reserved slot."""
+        self._length += count
+
+    def append(self, samples: np.ndarray):
+        self.reserve(len(samples))[:] = samples
+        self.commit(len(samples))
+
+    def view(self) -> np.ndarray:
+        """Zero-copy view of the committed samples."""
+        return self._data[:self._length]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from src.audio.resampler import Resampler
+from src.audio.stream_stats import StreamStats
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class NullPlayer:
+    """Drop-in for AudioPlayer that needs no output device.
+
+    Audio is consumed and counted in ``stats`` like real playback. With
+    ``realtime=True`` each stream takes as long as it would to play, so
+    barge-in and turn timings stay realistic; otherwise it returns as soon
+    as the producer is done. ``stop`` interrupts the current stream.
+    """
+
+    def __init__(self, realtime: bool = False):
+        self._realtime = realtime
+        self._stop_event = threading.Event()
+        self.stats = StreamStats("playback", 0)
+        self.first_audio_time: float | None = None  # monotonic, set per play_stream
+
+    def play(self, audio: np.ndarray, sample_rate: int):
+        if audio.dtype != np.int16:
+            audio = (audio * 32768.0).clip(-32768, 32767).astype(np.int16)
+        self.play_stream(iter([audio]), sample_rate)
+
+    def play_stream(self, chunks: Iterator[bytes], sample_rate: int):
+        self._stop_event.clear()
+        self.first_audio_time = None
+        self.stats.nominal_rate = sample_rate
+        started = None
+        played = 0
+        for chunk in chunks:
+            samples = chunk if isinstance(chunk, np.ndarray) else np.frombuffer(chunk, dtype=np.int16)
+            if self.first_audio_time is None:
+                self.first_audio_time = started = time.monotonic()
+            self._write(samples, sample_rate)
+            self.stats.samples += len(samples)
+            played += len(samples)
+            if self._realtime:
+                self._stop_event.wait(started + played / sample_rate - time.monotonic())
+            if self._stop_event.is_set():
+                break
+
+    def stop(self):
+        self._stop_event.set()
+
+    def close(self):
+        pass
+
+    def _write(self, samples: np.ndarray, sample_rate: int):
+        pass
+
+
+class RecordingPlayer(NullPlayer):
+    """NullPlayer that also writes everything played to a mono WAV file.
+
+    The file takes the rate of the first stream; later streams at another
+    rate are resampled to it.
+    """
+
+    def __init__(self, path: str | Path, realtime: bool = False):
+        super().__init__(realtime)
+        self._path = Path(path)
+        self._wav: wave.Wave_write | None = None
+        self._resampler: Resampler | None = None
+
+    def play_stream(self, chunks: Iterator[bytes], sample_rate: int):
+        if self._wav is not None and self._resampler.src_rate != sample_rate:
+            self._resampler = Resampler(sample_rate, self._resampler.dst_rate)
+        super().play_stream(chunks, sample_rate)
+        if self._wav is not None:
+            self._wav.writeframes(self._resampler.flush().tobytes())
+
+    def close(self):
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+            logger.info(f"Wrote played audio to {self._path}.")
+
+    def _write(self, samples: np.ndarray, sample_rate: int):
+        if self._wav is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._wav = wave.open(str(self._path), "wb")
+            self._wav.setnchannels(1)
+            self._wav.setsampwidth(2)
+            self._wav.setframerate(sample_rate)
+            self._resampler = Resampler(sample_rate, sample_rate)
+        self._wav.writeframes(self._resampler.process(samples).tobytes())
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.audio.resampler import Resampler
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from src.audio.capture import CaptureService
+
+logger = setup_logger(__name__)
+
+
+class AudioSource(ABC):
+    """Producer that feeds a CaptureService ring.
+
+    Sources deliver int16 mono (or interleaved) buffers at the service's
+    ``sample_rate`` through ``CaptureService.push``, at most ``chunk_size``
+    (+2 after resampling) samples per channel at a time.
+    """
+
+    native_rate: int  # rate the audio is produced at, before any resampling
+
+    @abstractmethod
+    def start(self, capture: CaptureService) -> None:
+        """Begin pushing audio into capture; must not block."""
+        ...
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop producing and release any device or file."""
+        ...
+
+
+class FileSource(AudioSource):
+    """Replays a 16-bit PCM WAV or headerless raw file as if it were the mic.
+
+    With ``realtime=True`` chunks are pushed on the wall-clock schedule of a
+    live microphone. Otherwise the file plays as fast as its consumers read:
+    a chunk is pushed only while some reader is blocked waiting for audio, so
+    wake word, VAD and STT throughput can be measured without lapping the
+    ring. Either way the capture ends when the file does, which stops every
+    reader once it has drained the buffer.
+
+    Raw files are int16 little-endian mono at ``raw_rate``. Files at another
+    rate than the capture are resampled.
+    """
+
+    def __init__(self, path: str | Path, sample_rate: int = 16000, chunk_size: int = 1024,
+                 realtime: bool = True, raw_rate: int = 0):
+        self._path = Path(path)
+        self._sample_rate = sample_rate
+        self._realtime = realtime
+        self._wav: wave.Wave_read | None = None
+        if self._path.suffix.lower() == ".wav":
+            self._wav = wave.open(str(self._path), "rb")
+            if self._wav.getsampwidth() != 2:
+                raise ValueError(f"{self._path}: only 16-bit PCM WAV is supported")
+            self._channels = self._wav.getnchannels()
+            self.native_rate = self._wav.getframerate()
+        else:
+            self._channels = 1
+            self.native_rate = raw_rate or sample_rate
+        self._resampler = Resampler(self.native_rate, sample_rate)
+        self._frames = round(chunk_size * self.native_rate / sample_rate)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, capture: CaptureService) -> None:
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(capture,), daemon=True)
+        self._thread.start()
+        mode = "real time" if self._realtime else "as fast as consumed"
+        logger.info(f"Replaying {self._path} ({self.native_rate} Hz, {mode}).")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+    def _chunks(self):
+        if self._wav is not None:
+            while data := self._wav.readframes(self._frames):
+                samples = np.frombuffer(data, dtype=np.int16)
+                if self._channels > 1:
+                    samples = samples.reshape(-1, self._channels).mean(axis=1).astype(np.int16)
+                yield samples
+            return
+        with open(self._path, "rb") as f:
+            while data := f.read(self._frames * 2):
+                yield np.frombuffer(data[:len(data) // 2 * 2], dtype=np.int16)
+
+    def _run(self, capture: CaptureService):
+        started = time.monotonic()
+        pushed = 0
+        try:
+            for frames in self._chunks():
+                if self._stop_event.is_set():
+                    return
+                if self._realtime:
+                    delay = started + pushed / self.native_rate - time.monotonic()
+                    if delay > 0:
+                        self._stop_event.wait(delay)
+                else:
+                    while not capture.wait_for_demand(timeout=0.5):
+                        if self._stop_event.is_set() or not capture.running:
+                            return
+                capture.push(self._resampler.process(frames), len(frames),
+                             short=len(frames) < self._frames)
+                pushed += len(frames)
+            tail = self._resampler.flush()
+            if len(tail):
+                capture.push(tail, 0)
+        finally:
+            logger.info(f"Replay of {self._path.name} finished "
+                        f"({pushed / self.native_rate:.1f}s in {time.monotonic() - started:.1f}s).")
+            capture.end()
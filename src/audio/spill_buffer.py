@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+import tempfile
+
+import numpy as np
+
+
+class SpillBuffer:
+    """Disk-backed drop-in for SampleBuffer for recordings of unbounded length.
+
+    Samples go to an anonymous temporary file through a memory map of one
+    fixed-size segment at a time. When a reservation runs past the mapped
+    segment, the segment is flushed and unmapped and the file is extended
+    for the next one. Resident memory stays around one segment no matter
+    how long the recording runs. ``view()`` maps the whole file read-only, so
+    STT reads it page by page without a copy. The file disappears once the
+    buffer and every view of it are gone.
+    """
+
+    def __init__(self, segment_samples: int = 16000 * 60, directory: str = ""):
+        self._file = tempfile.TemporaryFile(prefix="echovault-capture-", dir=directory or None)
+        self._segment = segment_samples
+        self._length = 0
+        self._file_samples = 0
+        self._window: np.memmap | None = None
+        self._window_start = 0
+        self.segments = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        return self._file_samples
+
+    def reserve(self, count: int) -> np.ndarray:
+        """Return a writable slot for the next count samples."""
+        start = self._length - self._window_start
+        if self._window is None or start + count > len(self._window):
+            self._map(self._length, max(count, self._segment))
+            start = 0
+        return self._window[start:start + count]
+
+    def commit(self, count: int):
+        """Keep the first count samples of the last reserved slot."""
+        self._length += count
+
+    def append(self, samples: np.ndarray):
+        self.reserve(len(samples))[:] = samples
+        self.commit(len(samples))
+
+    def view(self) -> np.ndarray:
+        """Read-only memory-mapped view of the committed samples."""
+        if self._window is not None:
+            self._window.flush()
+        if not self._length:
+            return np.zeros(0, dtype=np.int16)
+        return np.memmap(self._file, dtype=np.int16, mode="r", shape=(self._length,))
+
+    def close(self):
+        """Release the write mapping and this buffer's handle on the file."""
+        self._window = None
+        self._file.close()
+
+    def _map(self, start: int, count: int):
+        if self._window is not None:
+            self._window.flush()
+            self._window = None
+        if start + count > self._file_samples:
+            self._file_samples = start + count
+            os.ftruncate(self._file.fileno(), self._file_samples * 2)
+        self._window = np.memmap(self._file, dtype=np.int16, mode="r+",
+                                 offset=start * 2, shape=(count,))
+        self._window_start = start
+        self.segments += 1
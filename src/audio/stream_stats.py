@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import bisect
+import time
+
+# Upper bucket edges in milliseconds; the last bucket is open-ended.
+_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class LatencyHistogram:
+    """Fixed-bucket millisecond histogram, cheap enough for audio callbacks."""
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKETS_MS) + 1)
+        self.max_ms = 0.0
+
+    def record(self, ms: float):
+        self.counts[bisect.bisect_left(_BUCKETS_MS, ms)] += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def to_dict(self) -> dict:
+        labels = [f"<={edge}" for edge in _BUCKETS_MS] + [f">{_BUCKETS_MS[-1]}"]
+        return {
+            "buckets_ms": {label: n for label, n in zip(labels, self.counts) if n},
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class StreamStats:
+    """Counters for one audio stream or reader.
+
+    ``latency`` holds the time between capture callbacks (producer side) or
+    the time a reader blocked waiting for audio (consumer side).
+    ``short_reads`` counts source buffers shorter than requested,
+    ``timeouts`` reads that gave up waiting for audio, and ``underruns``
+    playback callbacks that found no audio queued mid-stream.
+
+    For ``continuous`` streams (capture, speaker playback) the effective rate
+    is samples moved per wall-clock second since creation, which should track
+    the nominal sample rate when nothing is being lost. Readers only run
+    while someone is listening, so their rate would say nothing and is
+    reported as None.
+    """
+
+    def __init__(self, name: str, nominal_rate: int, continuous: bool = False):
+        self.name = name
+        self.nominal_rate = nominal_rate
+        self.continuous = continuous
+        self.started = time.monotonic()
+        self.samples = 0
+        self.overflows = 0
+        self.underflows = 0
+        self.short_reads = 0
+        self.timeouts = 0
+        self.underruns = 0
+        self.dropped = 0
+        self.latency = LatencyHistogram()
+
+    def restart_rate(self, nominal_rate: int):
+        """Measure the effective rate afresh, e.g. when a stream is (re)opened."""
+        self.nominal_rate = nominal_rate
+        self.started = time.monotonic()
+        self.samples = 0
+
+    def snapshot(self) -> dict:
+        effective = ratio = None
+        # A continuous stream not yet opened (nominal_rate 0) has no rate either.
+        if self.continuous and self.nominal_rate:
+            elapsed = time.monotonic() - self.started
+            effective = round(self.samples / elapsed, 1) if elapsed > 0 else 0.0
+            ratio = round(effective / self.nominal_rate, 4)
+        return {
+            "samples": self.samples,
+            "overflows": self.overflows,
+            "underflows": self.underflows,
+            "short_reads": self.short_reads,
+            "timeouts": self.timeouts,
+            "underruns": self.underruns,
+            "dropped": self.dropped,
+            "effective_rate": effective,
+            "rate_ratio": ratio,
+            "latency": self.latency.to_dict(),
+        }
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.audio.sample_buffer import SampleBuffer
+
+DURATIONS = {"1s": 1.0, "30s": 30.0, "10min": 600.0}
+
+
+def _list_join(source: np.ndarray, chunk: int) -> tuple[np.ndarray, int, float]:
+    """Previous recorder behaviour: one bytes object per read, joined at the end."""
+    frames: list[bytes] = []
+    for start in range(0, len(source), chunk):
+        frames.append(source[start:start + chunk].tobytes())
+    end = time.perf_counter()
+    audio = np.frombuffer(b"".join(frames), dtype=np.int16)
+    return audio, len(frames) + 1, time.perf_counter() - end
+
+
+def _sample_buffer(source: np.ndarray, chunk: int, initial: int) -> tuple[np.ndarray, int, float]:
+    buffer = SampleBuffer(initial)
+    for start in range(0, len(source), chunk):
+        samples = source[start:start + chunk]
+        buffer.reserve(len(samples))[:] = samples
+        buffer.commit(len(samples))
+    end = time.perf_counter()
+    audio = buffer.view()
+    return audio, buffer.allocations, time.perf_counter() - end
+
+
+def run_capture_buffer_bench(sample_rate: int = 16000, chunk_size: int = 1024) -> list[dict]:
+    """Compare list[bytes] + join against SampleBuffer for several recording lengths.
+
+    Reports capture-path allocations, peak traced memory and the time from the
+    last captured chunk to a ready int16 array (end-of-utterance latency).
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for label, seconds in DURATIONS.items():
+        source = rng.integers(-3000, 3000, int(sample_rate * seconds), dtype=np.int16)
+        for name, run in (
+            ("list+join", lambda: _list_join(source, chunk_size)),
+            ("SampleBuffer", lambda: _sample_buffer(source, chunk_size, sample_rate * 30)),
+        ):
+            tracemalloc.start()
+            audio, allocations, latency = run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            assert len(audio) == len(source)
+            results.append({
+                "duration": label,
+                "method": name,
+                "allocations": allocations,
+                "peak_mb": peak / 1e6,
+                "end_latency_ms": latency * 1000,
+            })
+    return results
+
+
+def format_report(results: list[dict]) -> str:
+    lines = [f"{'duration':<10}{'method':<14}{'allocs':>8}{'peak MB':>10}{'end ms':>10}"]
+    for r in results:
+        lines.append(
+            f"{r['duration']:<10}{r['method']:<14}{r['allocations']:>8}"
+            f"{r['peak_mb']:>10.1f}{r['end_latency_ms']:>10.2f}"
+        )
+    return "\n".join(lines)
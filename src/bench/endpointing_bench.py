@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.audio.endpointer import Endpointer, frame_dbfs
+from src.bench.pipeline_bench import load_wav, summarize
+from src.config import VADConfig
+from src.vad.base import BaseVAD
+from src.vad.webrtc_vad import WebRTCVAD
+
+
+@dataclass
+class Utterance:
+    name: str
+    audio: np.ndarray
+    sample_rate: int
+    speech_start: float
+    speech_end: float | None  # None: no speech at all (music, TV, room noise)
+
+
+def load_corpus(directory: str | Path) -> list[Utterance]:
+    """Load WAV files and their speech labels.
+
+    Labels come from ``labels.json`` (``{"file.wav": 2.31, ...}``) or a
+    ``<name>.json`` sidecar. A number is the end of speech in seconds from
+    the start of the file; an object may also give ``speech_start``; ``null``
+    (or ``{"speech_end": null}``) marks a file with no speech in it.
+    """
+    directory = Path(directory)
+    labels_path = directory / "labels.json"
+    labels = json.loads(labels_path.read_text()) if labels_path.exists() else {}
+    corpus = []
+    for path in sorted(directory.glob("*.wav")):
+        sidecar = path.with_suffix(".json")
+        if path.name in labels:
+            label = labels[path.name]
+        elif sidecar.exists():
+            label = json.loads(sidecar.read_text())
+        else:
+            raise ValueError(f"{path}: no label in labels.json or {sidecar.name}")
+        if not isinstance(label, dict):
+            label = {"speech_end": label}
+        audio, sample_rate = load_wav(path)
+        speech_end = label.get("speech_end")
+        corpus.append(Utterance(path.name, audio, sample_rate,
+                                float(label.get("speech_start", 0.0)),
+                                None if speech_end is None else float(speech_end)))
+    return corpus
+
+
+def replay(audio: np.ndarray, sample_rate: int, vad: BaseVAD, endpointer: Endpointer,
+           frame_duration_ms: int) -> tuple[float | None, float | None]:
+    """Replay one file through VAD + endpointer like record_with_vad does.
+
+    Returns the speech onset and endpoint times in seconds; the endpoint is
+    None if speech never ended and both are None if none was detected.
+    """
+    frame_size = int(sample_rate * frame_duration_ms / 1000)
+    vad.reset()
+    endpointer.reset()
+    onset = None
+    for index in range(len(audio) // frame_size):
+        frame = audio[index * frame_size:(index + 1) * frame_size]
+        is_speech = vad.is_speech(frame)
+        if onset is None and is_speech:
+            onset = index * frame_size / sample_rate
+        if onset is None:
+            endpointer.observe_noise(frame_dbfs(frame))
+        elif endpointer.update(is_speech, frame):
+            return onset, (index + 1) * frame_size / sample_rate
+    return onset, None
+
+
+def pad(utterance: Utterance, seconds: float) -> np.ndarray:
+    """Append trailing silence so any endpointing window can expire."""
+    tail = np.zeros(int(utterance.sample_rate * seconds), dtype=np.int16)
+    return np.concatenate([utterance.audio, tail])
+
+
+def run_endpointing_bench(corpus: list[Utterance], vad_config: VADConfig) -> list[dict]:
+    """Compare the fixed silence timeout with adaptive endpointing.
+
+    Each file is padded with enough silence for the longest window to expire.
+    An endpoint before the labelled end of speech is a premature cut; for the
+    rest, latency is the time from the end of speech to the endpoint. Files
+    labelled as containing no speech are skipped.
+    """
+    corpus = [u for u in corpus if u.speech_end is not None]
+    strategies = {
+        f"fixed {vad_config.silence_timeout:.2f}s": dict(adaptive=False),
+        (f"adaptive {vad_config.min_silence_timeout:.2f}"
+         f"-{vad_config.max_silence_timeout:.2f}s"): dict(adaptive=True),
+    }
+    results = []
+    for name, options in strategies.items():
+        endpointer = Endpointer(
+            frame_duration_ms=vad_config.frame_duration_ms,
+            silence_timeout=vad_config.silence_timeout,
+            min_silence=vad_config.min_silence_timeout,
+            max_silence=vad_config.max_silence_timeout,
+            **options,
+        )
+        latencies, premature, missed = [], [], []
+        for utterance in corpus:
+            vad = WebRTCVAD(utterance.sample_rate, vad_config.aggressiveness)
+            audio = pad(utterance, vad_config.max_silence_timeout + 1.0)
+            _, endpoint = replay(audio, utterance.sample_rate, vad, endpointer,
+                                 vad_config.frame_duration_ms)
+            if endpoint is None:
+                missed.append(utterance.name)
+            elif endpoint < utterance.speech_end:
+                premature.append(utterance.name)
+            else:
+                latencies.append((endpoint - utterance.speech_end) * 1000)
+        results.append({
+            "strategy": name,
+            "files": len(corpus),
+            "premature": premature,
+            "missed": missed,
+            "premature_rate": len(premature) / len(corpus) if corpus else 0.0,
+            "latency_ms": summarize(latencies) if latencies else None,
+        })
+    return results
+
+
+def format_report(results: list[dict]) -> str:
+    lines = [f"{'strategy':<22}{'files':>6}{'cut %':>8}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"]
+    for r in results:
+        latency = r["latency_ms"] or {"p50": float("nan"), "p95": float("nan"), "max": float("nan")}
+        lines.append(
+            f"{r['strategy']:<22}{r['files']:>6}{r['premature_rate'] * 100:>8.1f}"
+            f"{latency['p50']:>9.0f}{latency['p95']:>9.0f}{latency['max']:>9.0f}"
+        )
+    for r in results:
+        if r["premature"]:
+            lines.append(f"{r['strategy']}: cut early on {', '.join(r['premature'])}")
+        if r["missed"]:
+            lines.append(f"{r['strategy']}: never endpointed {', '.join(r['missed'])}")
+    return "\n".join(lines)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_REPLIES = [
+    "Sure. It's currently sunny and about twenty degrees. "
+    "Later this afternoon there's a small chance of rain, so you might want an umbrella.",
+    "The meeting is at three o'clock. I can remind you fifteen minutes before it starts. "
+    "Would you like me to do that?",
+]
+
+
+class FakeAPIServer:
+    """Local stand-in for the Anthropic Messages and OpenAI transcription APIs.
+
+    Replies are canned and cycled. ``latency_ms`` delays the first byte of
+    every response; ``token_interval_ms`` spaces out streamed text deltas to
+    mimic generation speed. Point ``ClaudeLLM`` at ``anthropic_url`` and
+    ``WhisperAPISTT`` at ``openai_url``.
+    """
+
+    def __init__(self, replies: list[str] | None = None,
+                 transcript: str = "What's the weather like today?",
+                 latency_ms: float = 300.0, token_interval_ms: float = 20.0,
+                 host: str = "127.0.0.1", port: int = 0):
+        self._replies = itertools.cycle(replies or DEFAULT_REPLIES)
+        self._reply_lock = threading.Lock()
+        self.transcript = transcript
+        self.latency_ms = latency_ms
+        self.token_interval_ms = token_interval_ms
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def anthropic_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_url(self) -> str:
+        return f"{self.anthropic_url}/v1"
+
+    def start(self) -> FakeAPIServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Fake API server listening on {self.anthropic_url}")
+        return self
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def next_reply(self) -> str:
+        with self._reply_lock:
+            return next(self._replies)
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                time.sleep(fake.latency_ms / 1000)
+                if self.path.endswith("/messages"):
+                    request = json.loads(body or b"{}")
+                    if request.get("stream"):
+                        try:
+                            self._stream_message(request)
+                        except (BrokenPipeError, ConnectionResetError):
+                            pass  # client stopped reading (e.g. barge-in)
+                    else:
+                        self._send_json(_message(request, fake.next_reply()))
+                elif self.path.endswith("/audio/transcriptions"):
+                    self._send_json({"text": fake.transcript})
+                else:
+                    self.send_error(404)
+
+            def _send_json(self, payload: dict):
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream_message(self, request: dict):
+                reply = fake.next_reply()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+
+                message = _message(request, "")
+                message["content"] = []
+                message["stop_reason"] = None
+                self._event("message_start", {"type": "message_start", "message": message})
+                self._event("content_block_start", {
+                    "type": "content_block_start", "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                })
+                words = reply.split(" ")
+                for i, word in enumerate(words):
+                    text = word if i == 0 else " " + word
+                    self._event("content_block_delta", {
+                        "type": "content_block_delta", "index": 0,
+                        "delta": {"type": "text_delta", "text": text},
+                    })
+                    time.sleep(fake.token_interval_ms / 1000)
+                self._event("content_block_stop", {"type": "content_block_stop", "index": 0})
+                self._event("message_delta", {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": len(words)},
+                })
+                self._event("message_stop", {"type": "message_stop"})
+
+            def _event(self, name: str, payload: dict):
+                self.wfile.write(f"event: {name}\ndata: {json.dumps(payload)}\n\n".encode())
+                self.wfile.flush()
+
+        return Handler
+
+
+def _message(request: dict, text: str) -> dict:
+    return {
+        "id": "msg_bench",
+        "type": "message",
+        "role": "assistant",
+        "model": request.get("model", "bench"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 0, "output_tokens": len(text.split())},
+    }
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+import yaml
+
+from src.config import WHISPER_PROFILES, Config, VADConfig, WhisperConfig
+from src.utils.logger import setup_logger
+
+logger = setup_logger("echovault.bench")
+
+
+def _cmd_pipeline(args: argparse.Namespace):
+    from src.bench.fake_server import FakeAPIServer
+    from src.bench.pipeline_bench import format_report, run_pipeline_bench
+
+    fixtures = sorted(Path(args.fixtures).glob("*.wav"))
+    if not fixtures:
+        logger.error(f"No .wav fixtures found in {args.fixtures}")
+        sys.exit(1)
+
+    fake = None
+    if not args.live:
+        # Dummy keys keep Config validation happy; nothing leaves the machine.
+        os.environ.setdefault("ANTHROPIC_API_KEY", "bench")
+        if args.stt == "api":
+            os.environ.setdefault("OPENAI_API_KEY", "bench")
+        fake = FakeAPIServer(
+            transcript=args.transcript,
+            latency_ms=args.llm_latency_ms,
+            token_interval_ms=args.token_interval_ms,
+        ).start()
+
+    try:
+        config = Config.load(args.config)
+    except (ValueError, FileNotFoundError) as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    if args.stt:
+        config.whisper.backend = args.stt
+    if fake:
+        config.claude.base_url = fake.anthropic_url
+        config.whisper.base_url = fake.openai_url
+
+    try:
+        report = run_pipeline_bench(config, fixtures, runs=args.runs)
+    finally:
+        if fake:
+            fake.close()
+
+    print(format_report(report))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+        logger.info(f"Wrote report to {args.json}")
+
+
+def _cmd_capture_buffer(args: argparse.Namespace):
+    from src.bench.capture_buffer_bench import format_report, run_capture_buffer_bench
+
+    results = run_capture_buffer_bench(sample_rate=args.sample_rate, chunk_size=args.chunk_size)
+    print(format_report(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+def _cmd_endpointing(args: argparse.Namespace):
+    from src.bench.endpointing_bench import format_report, load_corpus, run_endpointing_bench
+
+    try:
+        corpus = load_corpus(args.corpus)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    if not corpus:
+        logger.error(f"No .wav files found in {args.corpus}")
+        sys.exit(1)
+
+    results = run_endpointing_bench(corpus, _load_vad_config(args.config))
+    print(format_report(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+def _cmd_vad(args: argparse.Namespace):
+    from src.bench.endpointing_bench import load_corpus
+    from src.bench.vad_bench import format_report, run_vad_bench
+
+    try:
+        corpus = load_corpus(args.corpus)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    if not corpus:
+        logger.error(f"No .wav files found in {args.corpus}")
+        sys.exit(1)
+
+    vad_config = _load_vad_config(args.config)
+    engines = {}
+    for name in args.engines.split(","):
+        if name == "webrtc":
+            from src.vad.webrtc_vad import WebRTCVAD
+            engines[name] = lambda rate: WebRTCVAD(rate, vad_config.aggressiveness)
+        elif name == "silero":
+            from src.vad.silero_vad import SileroVAD
+            engines[name] = lambda rate: SileroVAD(vad_config.model_path, rate, vad_config.threshold)
+        else:
+            logger.error(f"Unknown VAD engine '{name}'")
+            sys.exit(1)
+
+    try:
+        results = run_vad_bench(corpus, vad_config, engines)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    print(format_report(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+def _cmd_stt(args: argparse.Namespace):
+    from src.bench.stt_bench import format_report, run_stt_bench
+
+    fixtures = sorted(Path(args.fixtures).glob("*.wav"))
+    if not fixtures:
+        logger.error(f"No .wav fixtures found in {args.fixtures}")
+        sys.exit(1)
+
+    config = Config(whisper=WhisperConfig.from_dict(_load_section(args.config, "whisper", dict)))
+    config.whisper.api_key = config.whisper.api_key or os.getenv("OPENAI_API_KEY", "")
+    profiles = args.profiles.split(",") if args.profiles else [""]
+    unknown = set(profiles) - set(WHISPER_PROFILES) - {""}
+    if unknown:
+        logger.error(f"Unknown profile(s): {', '.join(sorted(unknown))}")
+        sys.exit(1)
+    results = run_stt_bench(config, args.backends.split(","), fixtures, runs=args.runs,
+                            profiles=profiles)
+    print(format_report(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+def _load_section(path: str, name: str, cls):
+    # Only one section is needed, so a missing API key or voice is not fatal here.
+    if not Path(path).exists():
+        return cls()
+    with open(path) as f:
+        return cls(**(yaml.safe_load(f) or {}).get(name, {}))
+
+
+def _load_vad_config(path: str) -> VADConfig:
+    return _load_section(path, "vad", VADConfig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EchoVault offline benchmarks")
+    parser.add_argument(
+        "--config",
+        default="config.yaml",
+        help="Path to config file (default: config.yaml)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("pipeline", help="Replay WAV fixtures through STT → LLM → TTS")
+    p.add_argument("fixtures", help="Directory of 16-bit PCM .wav fixtures")
+    p.add_argument("--runs", type=int, default=1, help="Passes over the fixtures (default: 1)")
+    p.add_argument("--stt", choices=["local", "parallel", "api"], default=None,
+                   help="Override whisper.backend from the config")
+    p.add_argument("--live", action="store_true",
+                   help="Call the real Anthropic/OpenAI APIs instead of the local stand-in")
+    p.add_argument("--llm-latency-ms", type=float, default=300.0,
+                   help="Stand-in time to first byte (default: 300)")
+    p.add_argument("--token-interval-ms", type=float, default=20.0,
+                   help="Stand-in delay between streamed words (default: 20)")
+    p.add_argument("--transcript", default="What's the weather like today?",
+                   help="Canned text returned by the Whisper API stand-in")
+    p.add_argument("--json", help="Also write the full report to this path")
+    p.set_defaults(func=_cmd_pipeline)
+
+    p = sub.add_parser("capture-buffer",
+                       help="Compare capture buffering strategies for 1 s, 30 s and 10 min recordings")
+    p.add_argument("--sample-rate", type=int, default=16000)
+    p.add_argument("--chunk-size", type=int, default=1024)
+    p.add_argument("--json", help="Also write the results to this path")
+    p.set_defaults(func=_cmd_capture_buffer)
+
+    p = sub.add_parser("endpointing",
+                       help="Endpoint latency vs premature cuts, fixed vs adaptive, on a labelled corpus")
+    p.add_argument("corpus", help="Directory of .wav files with labels.json or <name>.json speech_end labels")
+    p.add_argument("--json", help="Also write the results to this path")
+    p.set_defaults(func=_cmd_endpointing)
+
+    p = sub.add_parser("vad", help="Per-frame CPU and extra audio sent to STT for each VAD engine")
+    p.add_argument("corpus", help="Labelled .wav directory (same format as endpointing)")
+    p.add_argument("--engines", default="webrtc,silero",
+                   help="Comma-separated engines to compare (default: webrtc,silero)")
+    p.add_argument("--json", help="Also write the results to this path")
+    p.set_defaults(func=_cmd_vad)
+
+    p = sub.add_parser("stt", help="Real-time factor and WER of STT backends on the same fixtures")
+    p.add_argument("fixtures", help="Directory of .wav fixtures with optional <name>.txt references")
+    p.add_argument("--backends", default="local,faster-whisper",
+                   help="Comma-separated whisper.backend values (default: local,faster-whisper)")
+    p.add_argument("--profiles", default="",
+                   help="Comma-separated decoding profiles to run each backend with, "
+                        "e.g. fast,accurate (default: the config's decoding options)")
+    p.add_argument("--runs", type=int, default=1, help="Passes over the fixtures (default: 1)")
+    p.add_argument("--json", help="Also write the results to this path")
+    p.set_defaults(func=_cmd_stt)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import resource
+import time
+import wave
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from src.audio.sinks import NullPlayer
+from src.config import Config
+from src.main import build_llm, build_stt, build_tts, load_in_parallel
+from src.pipeline.turn_pipeline import TurnPipeline
+from src.tts.base import BaseTTS
+from src.utils.logger import setup_logger
+from src.utils.tracing import LatencyTracer, percentile
+
+logger = setup_logger(__name__)
+
+
+def load_wav(path: str | Path) -> tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV file as mono int16 samples."""
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV fixtures are supported")
+        channels = wf.getnchannels()
+        sample_rate = wf.getframerate()
+        audio = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return audio, sample_rate
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values),
+    }
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if rss > 1 << 30 else rss / 1024
+
+
+class _TimedTTS(BaseTTS):
+    """Wraps a TTS engine and accumulates synthesis time and output length."""
+
+    def __init__(self, tts: BaseTTS):
+        self._tts = tts
+        self.seconds = 0.0
+        self.samples = 0
+
+    def reset(self):
+        self.seconds = 0.0
+        self.samples = 0
+
+    def synthesize(self, text: str) -> np.ndarray:
+        start = time.perf_counter()
+        audio = self._tts.synthesize(text)
+        self.seconds += time.perf_counter() - start
+        self.samples += len(audio)
+        return audio
+
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        chunks = self._tts.synthesize_stream(text)
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            self.seconds += time.perf_counter() - start
+            if chunk is None:
+                return
+            self.samples += len(chunk) // 2
+            yield chunk
+
+    def get_sample_rate(self) -> int:
+        return self._tts.get_sample_rate()
+
+
+def run_pipeline_bench(config: Config, fixtures: list[Path], runs: int = 1) -> dict:
+    """Replay fixtures through the push-to-talk stages and collect metrics.
+
+    Each fixture is treated as an already-endpointed utterance: the turn
+    starts at STT and ends when the last synthesized chunk is consumed.
+    Conversation history is reset between fixtures so turns are independent.
+    """
+    load_start = time.perf_counter()
+    loaded = load_in_parallel({
+        "stt": lambda: build_stt(config),
+        "llm": lambda: build_llm(config),
+        "tts": lambda: build_tts(config),
+    })
+    load_seconds = time.perf_counter() - load_start
+    stt, llm = loaded["stt"], loaded["llm"]
+    tts = _TimedTTS(loaded["tts"])
+
+    player = NullPlayer()
+    pipeline = TurnPipeline(llm, tts, player)
+    tracer = LatencyTracer(mode="bench", path=None)
+
+    results = []
+    stt_rtf: list[float] = []
+    tts_rtf: list[float] = []
+    cpu: list[float] = []
+
+    for run in range(runs):
+        for path in fixtures:
+            audio, sample_rate = load_wav(path)
+            duration = len(audio) / sample_rate
+            trace = tracer.start_turn()
+            tts.reset()
+            cpu_start = cpu_seconds()
+
+            trace.mark("endpoint")
+            trace.mark("stt_start")
+            text = stt.transcribe(audio, sample_rate)
+            trace.mark("stt_end")
+
+            reply = ""
+            if text:
+                reply = pipeline.run(text, trace)
+                llm.reset_conversation()
+            tracer.finish(trace)
+
+            result = {
+                "fixture": path.name,
+                "run": run,
+                "audio_seconds": round(duration, 3),
+                "transcript": text,
+                "reply_chars": len(reply),
+                "spans_ms": trace.to_dict()["spans_ms"],
+                "cpu_seconds": round(cpu_seconds() - cpu_start, 3),
+            }
+            spans = trace.spans()
+            if "stt" in spans and duration > 0:
+                result["stt_rtf"] = spans["stt"] / 1000 / duration
+                stt_rtf.append(result["stt_rtf"])
+            if tts.samples:
+                result["tts_rtf"] = tts.seconds / (tts.samples / tts.get_sample_rate())
+                tts_rtf.append(result["tts_rtf"])
+            cpu.append(result["cpu_seconds"])
+            results.append(result)
+            logger.info(f"{path.name} (run {run + 1}): {result['spans_ms']}")
+    stt.close()
+
+    return {
+        "load_seconds": round(load_seconds, 2),
+        "spans_ms": tracer.summary(),
+        "stt_rtf": summarize(stt_rtf) if stt_rtf else {},
+        "tts_rtf": summarize(tts_rtf) if tts_rtf else {},
+        "cpu_seconds_per_turn": summarize(cpu) if cpu else {},
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "turns": results,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"Model load: {report['load_seconds']:.2f}s   Peak RSS: {report['peak_rss_mb']:.0f} MB", ""]
+    lines.append(f"{'metric':<28}{'n':>5}{'p50':>10}{'p95':>10}")
+    for name, s in report["spans_ms"].items():
+        lines.append(f"{name + ' (ms)':<28}{s['count']:>5}{s['p50']:>10.0f}{s['p95']:>10.0f}")
+    for key in ("stt_rtf", "tts_rtf", "cpu_seconds_per_turn"):
+        s = report[key]
+        if s:
+            lines.append(f"{key:<28}{s['count']:>5}{s['p50']:>10.3f}{s['p95']:>10.3f}")
+    return "\n".join(lines)
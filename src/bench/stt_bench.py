@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import platform
+import re
+import time
+from pathlib import Path
+
+from src.bench.pipeline_bench import cpu_seconds, load_wav, summarize
+from src.config import WHISPER_PROFILES, Config
+from src.main import build_stt
+
+
+def normalize(text: str) -> list[str]:
+    """Lowercase words with punctuation removed, for WER scoring."""
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_errors(reference: list[str], hypothesis: list[str]) -> int:
+    """Word-level Levenshtein distance (substitutions + insertions + deletions)."""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ref_word != hyp_word)))
+        previous = current
+    return previous[-1]
+
+
+def host_info() -> str:
+    """CPU model and core count, so published numbers say where they were measured."""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpu = next(line.split(":", 1)[1].strip() for line in f if line.startswith("model name"))
+    except (OSError, StopIteration):
+        pass
+    return f"{cpu or platform.machine()}, {os.cpu_count()} cores, {platform.system()}"
+
+
+def run_stt_bench(config: Config, backends: list[str], fixtures: list[Path],
+                  runs: int = 1, profiles: list[str] | None = None) -> list[dict]:
+    """Transcribe the same fixtures with each backend and decoding profile.
+
+    Reports load time, real-time factor (transcription time / audio length)
+    and corpus WER against ``<fixture>.txt`` references where present.
+    Each backend is warmed up once before timing. A profile replaces the
+    config's decoding options with ``WHISPER_PROFILES[profile]``; "" keeps
+    them as configured.
+    """
+    audio = [(path, *load_wav(path)) for path in fixtures]
+    references = {path: normalize(path.with_suffix(".txt").read_text())
+                  for path in fixtures if path.with_suffix(".txt").exists()}
+
+    base = config.whisper
+    combinations = [(backend, profile) for backend in backends for profile in profiles or [""]]
+    results = []
+    for backend, profile in combinations:
+        config.whisper = dataclasses.replace(base, backend=backend, profile=profile or base.profile,
+                                             **WHISPER_PROFILES.get(profile, {}))
+        start = time.perf_counter()
+        stt = build_stt(config)
+        load_seconds = time.perf_counter() - start
+        rtf: list[float] = []
+        errors = words = 0
+        transcripts = {}
+        try:
+            stt.warmup()
+            cpu_start = cpu_seconds()
+            for run in range(runs):
+                for path, samples, sample_rate in audio:
+                    start = time.perf_counter()
+                    text = stt.transcribe(samples, sample_rate)
+                    rtf.append((time.perf_counter() - start) / (len(samples) / sample_rate))
+                    transcripts[path.name] = text
+                    if run == 0 and path in references:
+                        errors += word_errors(references[path], normalize(text))
+                        words += len(references[path])
+            cpu_total = cpu_seconds() - cpu_start
+        finally:
+            # Parallel workers each hold a model; free them before the next backend.
+            stt.close()
+        results.append({
+            "backend": backend,
+            "profile": config.whisper.profile,
+            "model": config.whisper.model,
+            "load_seconds": round(load_seconds, 2),
+            "rtf": summarize(rtf),
+            "cpu_seconds": round(cpu_total, 2),
+            "wer": errors / words if words else None,
+            "transcripts": transcripts,
+        })
+        del stt
+    config.whisper = base
+    return results
+
+
+def format_report(results: list[dict]) -> str:
+    models = sorted({r["model"] for r in results})
+    lines = [f"Host: {host_info()}; model: {', '.join(models)}",
+             f"{'backend':<16}{'profile':<10}{'load s':>8}{'RTF p50':>9}{'RTF p95':>9}{'CPU s':>8}{'WER %':>8}"]
+    for r in results:
+        wer = f"{r['wer'] * 100:.1f}" if r["wer"] is not None else "-"
+        lines.append(
+            f"{r['backend']:<16}{r['profile'] or '-':<10}{r['load_seconds']:>8.1f}{r['rtf']['p50']:>9.3f}"
+            f"{r['rtf']['p95']:>9.3f}{r['cpu_seconds']:>8.1f}{wer:>8}"
+        )
+    return "\n".join(lines)
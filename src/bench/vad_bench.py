@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import numpy as np
+
+from src.audio.endpointer import Endpointer
+from src.bench.endpointing_bench import Utterance, pad, replay
+from src.bench.pipeline_bench import summarize
+from src.config import VADConfig
+from src.vad.base import BaseVAD
+
+
+class _TimedVAD(BaseVAD):
+    """Wraps a VAD engine and records the CPU time of every frame."""
+
+    def __init__(self, vad: BaseVAD):
+        self._vad = vad
+        self.frame_us: list[float] = []
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        start = time.thread_time_ns()
+        result = self._vad.is_speech(frame)
+        self.frame_us.append((time.thread_time_ns() - start) / 1000)
+        return result
+
+    def reset(self) -> None:
+        self._vad.reset()
+
+
+def run_vad_bench(corpus: list[Utterance], vad_config: VADConfig,
+                  engines: dict[str, Callable[[int], BaseVAD]]) -> list[dict]:
+    """Replay the corpus through each VAD engine with the configured endpointing.
+
+    Engines are built once per run from their sample rate, which must be the
+    same for every file. Per-frame cost is thread CPU time inside the engine.
+    Extra audio is what record_with_vad would hand to STT beyond the labelled
+    speech: lead-in from an early onset, trailing audio after the endpoint,
+    and whole recordings triggered on files with no speech (music, TV).
+    """
+    rates = {u.sample_rate for u in corpus}
+    if len(rates) > 1:
+        raise ValueError(f"All corpus files must share one sample rate, got {sorted(rates)}")
+    sample_rate = rates.pop() if rates else 16000
+
+    results = []
+    for name, build in engines.items():
+        vad = _TimedVAD(build(sample_rate))
+        endpointer = Endpointer(
+            frame_duration_ms=vad_config.frame_duration_ms,
+            silence_timeout=vad_config.silence_timeout,
+            min_silence=vad_config.min_silence_timeout,
+            max_silence=vad_config.max_silence_timeout,
+            adaptive=vad_config.adaptive_endpointing,
+        )
+        sent, extra = 0.0, 0.0
+        false_triggers, missed = [], []
+        for utterance in corpus:
+            audio = pad(utterance, vad_config.max_silence_timeout + 1.0)
+            onset, endpoint = replay(audio, sample_rate, vad, endpointer,
+                                     vad_config.frame_duration_ms)
+            if onset is None:
+                if utterance.speech_end is not None:
+                    missed.append(utterance.name)
+                continue
+            recorded = (endpoint if endpoint is not None else len(audio) / sample_rate) - onset
+            sent += recorded
+            if utterance.speech_end is None:
+                false_triggers.append(utterance.name)
+                extra += recorded
+            else:
+                extra += max(0.0, recorded - (utterance.speech_end - utterance.speech_start))
+        results.append({
+            "engine": name,
+            "files": len(corpus),
+            "frame_cpu_us": summarize(vad.frame_us) if vad.frame_us else None,
+            "audio_to_stt_s": round(sent, 2),
+            "extra_audio_s": round(extra, 2),
+            "false_triggers": false_triggers,
+            "missed": missed,
+        })
+    return results
+
+
+def format_report(results: list[dict]) -> str:
+    lines = [f"{'engine':<10}{'files':>6}{'us/frame':>10}{'p95 us':>9}"
+             f"{'to STT s':>10}{'extra s':>9}{'false':>7}{'missed':>8}"]
+    for r in results:
+        cpu = r["frame_cpu_us"] or {"mean": float("nan"), "p95": float("nan")}
+        lines.append(
+            f"{r['engine']:<10}{r['files']:>6}{cpu['mean']:>10.1f}{cpu['p95']:>9.1f}"
+            f"{r['audio_to_stt_s']:>10.1f}{r['extra_audio_s']:>9.1f}"
+            f"{len(r['false_triggers']):>7}{len(r['missed']):>8}"
+        )
+    return "\n".join(lines)
@@ -14,15 +14,78 @@ class AudioConfig:
     channels: int = 1
     chunk_size: int = 1024
     format: str = "int16"
+    device_sample_rate: int = 0  # mic rate if different from sample_rate (e.g. 48000); 0 = sample_rate
+    output_sample_rate: int = 0  # fixed speaker rate (e.g. 48000); 0 = open at each source's rate
+    long_capture: bool = False  # push-to-talk records to a memory-mapped temp file
+    spill_dir: str = ""  # where long_capture files go; "" = system temp dir
+
+
+# Decoding presets selected with whisper.profile. Keys set explicitly in the
+# whisper section override the preset.
+WHISPER_PROFILES: dict[str, dict] = {
+    "fast": {
+        "beam_size": 1,
+        "best_of": 1,
+        "temperature": [0.0],
+        "condition_on_previous_text": False,
+        "without_timestamps": True,
+    },
+    "accurate": {
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        "condition_on_previous_text": True,
+        "without_timestamps": False,
+    },
+}
 
 
 @dataclass
 class WhisperConfig:
-    backend: str = "local"  # "local" or "api" (OpenAI Whisper API)
+    backend: str = "local"  # "local", "faster-whisper", "parallel" (multi-process CPU) or "api"
     model: str = "turbo"
     device: str = "auto"
-    language: str = "en"
+    language: str = "en"  # "" = detect per utterance
     api_key: str = ""
+    base_url: str = ""  # Override the OpenAI API endpoint (api backend only)
+    block_seconds: float = 600.0  # longer recordings are transcribed in blocks (local, faster-whisper)
+    short_seconds: float = 10.0  # local backend: reduced-context fast path below this, 0 = off
+    quantize: bool = False  # local/parallel backends on CPU: dynamic int8 Linear layers
+    quantize_cache_dir: str = "models/whisper-int8"  # quantized weights, per model and torch version
+    workers: int = 0  # parallel backend: worker processes, 0 = cores / threads_per_worker
+    threads_per_worker: int = 0  # parallel backend: torch threads per worker, 0 = auto
+    segment_seconds: float = 30.0  # parallel backend: max segment length between pauses
+    compute_type: str = "int8"  # faster-whisper backend: int8, int8_float32, float16, float32, ...
+    cpu_threads: int = 0  # faster-whisper backend: 0 = CTranslate2 default
+    profile: str = ""  # "fast" or "accurate" decoding preset; "" = the fields below
+    beam_size: int = 1  # 1 = greedy
+    best_of: int = 5  # candidates sampled at each non-zero temperature
+    temperature: list[float] = field(default_factory=lambda: [0.0, 0.2, 0.4, 0.6, 0.8, 1.0])
+    condition_on_previous_text: bool = True  # prompt each 30 s window with the previous text
+    without_timestamps: bool = False
+    streaming: bool = False  # transcribe while the user speaks (always-listening, on-device backends)
+    stream_interval_ms: int = 500
+
+    def __post_init__(self):
+        # YAML may give a single temperature instead of a fallback schedule.
+        if isinstance(self.temperature, (int, float)):
+            self.temperature = [float(self.temperature)]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> WhisperConfig:
+        """Build from a YAML section, filling unset decoding options from its profile."""
+        return cls(**{**WHISPER_PROFILES.get(data.get("profile", ""), {}), **data})
+
+    def decoding_options(self) -> dict:
+        """Language and decoding keyword arguments shared by the on-device backends."""
+        return {
+            "language": self.language,
+            "beam_size": self.beam_size,
+            "best_of": self.best_of,
+            "temperature": tuple(self.temperature),
+            "condition_on_previous_text": self.condition_on_previous_text,
+            "without_timestamps": self.without_timestamps,
+        }
 
 
 @dataclass
@@ -37,6 +100,7 @@ class ClaudeConfig:
     )
     max_history_pairs: int = 10
     api_key: str = ""
+    base_url: str = ""  # Override the Anthropic API endpoint
 
 
 @dataclass
@@ -47,9 +111,30 @@ class PiperConfig:
 
 @dataclass
 class VADConfig:
-    aggressiveness: int = 2
+    engine: str = "webrtc"  # "webrtc" or "silero" (ONNX neural VAD)
+    aggressiveness: int = 2  # webrtc only
+    model_path: str = "models/silero_vad.onnx"  # silero only
+    threshold: float = 0.5  # silero only
     silence_timeout: float = 1.0
     frame_duration_ms: int = 30
+    adaptive_endpointing: bool = True
+    min_silence_timeout: float = 0.5
+    max_silence_timeout: float = 2.0
+
+
+@dataclass
+class EnergyGateConfig:
+    enabled: bool = True
+    margin_db: float = 8.0  # frames this close to the noise floor skip VAD / wake word inference
+    hangover_ms: int = 300
+    probe_interval_ms: int = 1000
+
+
+@dataclass
+class BargeInConfig:
+    enabled: bool = False
+    aggressiveness: int = 3
+    min_speech_ms: int = 90
 
 
 @dataclass
@@ -57,6 +142,21 @@ class OpenWakeWordConfig:
     model_name: str = "hey_jarvis"
     threshold: float = 0.5
     chunk_size: int = 1280
+    preroll_ms: int = 0
+
+
+@dataclass
+class WarmupConfig:
+    enabled: bool = True
+    runs: int = 2  # first run is the cold one; later runs report warm timings
+
+
+@dataclass
+class TracingConfig:
+    enabled: bool = True
+    path: str = "logs/turns.jsonl"
+    max_bytes: int = 5_000_000
+    backup_count: int = 3
 
 
 @dataclass
@@ -66,7 +166,11 @@ class Config:
     claude: ClaudeConfig = field(default_factory=ClaudeConfig)
     piper: PiperConfig = field(default_factory=PiperConfig)
     vad: VADConfig = field(default_factory=VADConfig)
+    energy_gate: EnergyGateConfig = field(default_factory=EnergyGateConfig)
+    barge_in: BargeInConfig = field(default_factory=BargeInConfig)
     wakeword: OpenWakeWordConfig = field(default_factory=OpenWakeWordConfig)
+    warmup: WarmupConfig = field(default_factory=WarmupConfig)
+    tracing: TracingConfig = field(default_factory=TracingConfig)
 
     @classmethod
     def load(cls, path: str = "config.yaml") -> Config:
@@ -80,11 +184,15 @@ class Config:
 
         config = cls(
             audio=AudioConfig(**data.get("audio", {})),
-            whisper=WhisperConfig(**data.get("whisper", {})),
+            whisper=WhisperConfig.from_dict(data.get("whisper", {})),
             claude=ClaudeConfig(**data.get("claude", {})),
             piper=PiperConfig(**data.get("piper", {})),
             vad=VADConfig(**data.get("vad", {})),
+            energy_gate=EnergyGateConfig(**data.get("energy_gate", {})),
+            barge_in=BargeInConfig(**data.get("barge_in", {})),
             wakeword=OpenWakeWordConfig(**data.get("wakeword", {})),
+            warmup=WarmupConfig(**data.get("warmup", {})),
+            tracing=TracingConfig(**data.get("tracing", {})),
         )
 
         api_key = os.getenv("ANTHROPIC_API_KEY", "")
@@ -103,6 +211,27 @@ class Config:
             raise ValueError(
                 "ANTHROPIC_API_KEY not set. Add it to .env or set the environment variable."
             )
+        if self.whisper.backend not in ("local", "faster-whisper", "parallel", "api"):
+            raise ValueError(
+                f"Unknown whisper.backend '{self.whisper.backend}' "
+                "(expected 'local', 'faster-whisper', 'parallel' or 'api')."
+            )
+        if self.whisper.profile and self.whisper.profile not in WHISPER_PROFILES:
+            raise ValueError(
+                f"Unknown whisper.profile '{self.whisper.profile}' "
+                f"(expected one of {', '.join(WHISPER_PROFILES)})."
+            )
+        if not self.whisper.temperature:
+            raise ValueError("whisper.temperature needs at least one value.")
+        if self.whisper.streaming and self.whisper.backend not in ("local", "faster-whisper"):
+            raise ValueError("whisper.streaming needs the 'local' or 'faster-whisper' backend.")
+        if self.vad.engine not in ("webrtc", "silero"):
+            raise ValueError(f"Unknown vad.engine '{self.vad.engine}' (expected 'webrtc' or 'silero').")
+        if self.vad.engine == "silero" and not Path(self.vad.model_path).exists():
+            raise FileNotFoundError(
+                f"Silero VAD model not found at {self.vad.model_path}. "
+                "See the Voice activity detection section of the README."
+            )
         if self.whisper.backend == "api" and not self.whisper.api_key:
             raise ValueError(
                 "OPENAI_API_KEY not set. Required when whisper.backend is 'api'. "
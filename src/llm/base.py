@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 
 class BaseLLM(ABC):
@@ -9,6 +10,13 @@ class BaseLLM(ABC):
         """Generate a response to the user message."""
         ...
 
+    def respond_stream(self, user_message: str) -> Iterator[str]:
+        """Yield the response as text deltas. Defaults to a single full-text delta."""
+        yield self.respond(user_message)
+
+    def abort(self):
+        """Stop a respond_stream running on another thread. Defaults to a no-op."""
+
     @abstractmethod
     def reset_conversation(self):
         """Clear conversation history."""
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import socket
+from typing import Iterator
+
 import anthropic
 
 from src.llm.base import BaseLLM
@@ -11,16 +14,31 @@ logger = setup_logger(__name__)
 class ClaudeLLM(BaseLLM):
     def __init__(self, api_key: str, model: str = "claude-sonnet-4-5-20250929",
                  max_tokens: int = 1024, system_prompt: str = "",
-                 max_history_pairs: int = 10):
-        self._client = anthropic.Anthropic(api_key=api_key)
+                 max_history_pairs: int = 10, base_url: str = ""):
+        self._client = anthropic.Anthropic(api_key=api_key, base_url=base_url or None)
         self._model = model
         self._max_tokens = max_tokens
         self._system_prompt = system_prompt
         self._max_history_pairs = max_history_pairs
         self._history: list[dict] = []
+        # Active MessageStream, shut down by abort() from another thread.
+        self._stream = None
+        self._aborted = False
         logger.info(f"Claude LLM initialized (model={model}).")
 
     def respond(self, user_message: str, conversation_history: list[dict] | None = None) -> str:
+        return "".join(self.respond_stream(user_message))
+
+    def respond_stream(self, user_message: str) -> Iterator[str]:
+        """Yield text deltas from the streaming Messages API.
+
+        Server tool blocks (web_search calls and results) carry no text deltas
+        and are skipped. The final content is recorded in history once the
+        stream completes; if the consumer stops early, only the text already
+        yielded is kept so the history matches what was spoken. ``abort()``
+        shuts down the HTTP connection, so a consumer blocked waiting for the next
+        delta returns at once instead of at the next server event.
+        """
         self._history.append({"role": "user", "content": user_message})
 
         # Trim history to max pairs (user + assistant = 2 messages per pair)
@@ -28,21 +46,54 @@ class ClaudeLLM(BaseLLM):
         if len(self._history) > max_messages:
             self._history = self._history[-max_messages:]
 
-        response = self._client.messages.create(
-            model=self._model,
-            max_tokens=self._max_tokens,
-            system=self._system_prompt,
-            messages=self._history,
-            tools=[{"type": "web_search_20250305", "name": "web_search", "max_uses": 3}],
-        )
-
-        # Extract text from response (skip search result blocks)
-        assistant_text = "".join(
-            block.text for block in response.content if block.type == "text"
-        )
-        self._history.append({"role": "assistant", "content": response.content})
+        parts: list[str] = []
+        content = None
+        self._aborted = False
+        try:
+            with self._client.messages.stream(
+                model=self._model,
+                max_tokens=self._max_tokens,
+                system=self._system_prompt,
+                messages=self._history,
+                tools=[{"type": "web_search_20250305", "name": "web_search", "max_uses": 3}],
+            ) as stream:
+                self._stream = stream
+                try:
+                    for text in stream.text_stream:
+                        parts.append(text)
+                        yield text
+                    content = stream.get_final_message().content
+                except Exception:
+                    # Reading a response closed by abort() fails; that is the stop.
+                    if not self._aborted:
+                        raise
+        finally:
+            self._stream = None
+            if content is not None:
+                self._history.append({"role": "assistant", "content": content})
+            elif parts:
+                self._history.append({"role": "assistant", "content": "".join(parts)})
+            else:
+                self._history.pop()
+
+        assistant_text = "".join(parts)
         logger.info(f"Claude response: {assistant_text[:80]}...")
-        return assistant_text
+
+    def abort(self):
+        self._aborted = True
+        stream = self._stream
+        if stream is None:
+            return
+        # Closing the response does not wake a recv() blocked in another
+        # thread; shutting the socket down does.
+        network = stream.response.extensions.get("network_stream")
+        sock = network.get_extra_info("socket") if network is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # already closed
+        stream.close()
 
     def reset_conversation(self):
         self._history.clear()
@@ -2,53 +2,248 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
 from src.config import Config
 from src.ui.event_bus import EventBus
 from src.utils.logger import setup_logger
-from src.audio.recorder import AudioRecorder
-from src.audio.player import AudioPlayer
 from src.llm.claude_llm import ClaudeLLM
 from src.tts.piper_tts import PiperTTS
+from src.pipeline.turn_pipeline import TurnPipeline
+from src.utils.tracing import LatencyTracer
 
 logger = setup_logger("echovault")
 
 
-def build_components(config: Config):
-    recorder = AudioRecorder(
-        sample_rate=config.audio.sample_rate,
-        channels=config.audio.channels,
-        chunk_size=config.audio.chunk_size,
-    )
-    player = AudioPlayer()
-
+def build_stt(config: Config):
     if config.whisper.backend == "api":
         from src.stt.whisper_api_stt import WhisperAPISTT
-        stt = WhisperAPISTT(api_key=config.whisper.api_key)
-    else:
-        from src.stt.whisper_stt import WhisperSTT
-        stt = WhisperSTT(
+        return WhisperAPISTT(
+            api_key=config.whisper.api_key,
+            base_url=config.whisper.base_url,
+            language=config.whisper.language,
+            temperature=config.whisper.temperature[0],
+        )
+
+    if config.whisper.backend == "faster-whisper":
+        from src.stt.faster_whisper_stt import FasterWhisperSTT
+        return FasterWhisperSTT(
             model_name=config.whisper.model,
             device=config.whisper.device,
+            compute_type=config.whisper.compute_type,
+            cpu_threads=config.whisper.cpu_threads,
+            block_seconds=config.whisper.block_seconds,
+            **config.whisper.decoding_options(),
         )
 
-    llm = ClaudeLLM(
+    if config.whisper.backend == "parallel":
+        from src.stt.parallel_stt import ParallelWhisperSTT
+        return ParallelWhisperSTT(
+            model_name=config.whisper.model,
+            workers=config.whisper.workers,
+            threads_per_worker=config.whisper.threads_per_worker,
+            segment_seconds=config.whisper.segment_seconds,
+            vad=build_vad(config),
+            vad_sample_rate=config.audio.sample_rate,
+            vad_frame_ms=config.vad.frame_duration_ms,
+            quantize=config.whisper.quantize,
+            cache_dir=config.whisper.quantize_cache_dir,
+            **config.whisper.decoding_options(),
+        )
+
+    from src.stt.whisper_stt import WhisperSTT
+    return WhisperSTT(
+        model_name=config.whisper.model,
+        device=config.whisper.device,
+        block_seconds=config.whisper.block_seconds,
+        short_seconds=config.whisper.short_seconds,
+        quantize=config.whisper.quantize,
+        cache_dir=config.whisper.quantize_cache_dir,
+        **config.whisper.decoding_options(),
+    )
+
+
+def build_llm(config: Config) -> ClaudeLLM:
+    return ClaudeLLM(
         api_key=config.claude.api_key,
         model=config.claude.model,
         max_tokens=config.claude.max_tokens,
         system_prompt=config.claude.system_prompt,
         max_history_pairs=config.claude.max_history_pairs,
+        base_url=config.claude.base_url,
     )
-    tts = PiperTTS(
+
+
+def build_tts(config: Config) -> PiperTTS:
+    return PiperTTS(
         model_path=config.piper.model_path,
         config_path=config.piper.config_path,
     )
-    return recorder, player, stt, llm, tts
 
 
-def run_push_to_talk(config: Config, event_bus: EventBus):
+def build_vad(config: Config, aggressiveness: int | None = None):
+    """VAD for config.vad.engine; aggressiveness overrides vad.aggressiveness (webrtc)."""
+    if config.vad.engine == "silero":
+        from src.vad.silero_vad import SileroVAD
+        return SileroVAD(
+            model_path=config.vad.model_path,
+            sample_rate=config.audio.sample_rate,
+            threshold=config.vad.threshold,
+        )
+
+    from src.vad.webrtc_vad import WebRTCVAD
+    return WebRTCVAD(sample_rate=config.audio.sample_rate,
+                     aggressiveness=config.vad.aggressiveness if aggressiveness is None
+                     else aggressiveness)
+
+
+def build_energy_gate(config: Config, frame_duration_ms: int):
+    from src.audio.energy_gate import EnergyGate
+    return EnergyGate(
+        frame_duration_ms=frame_duration_ms,
+        margin_db=config.energy_gate.margin_db,
+        hangover_ms=config.energy_gate.hangover_ms,
+        probe_interval_ms=config.energy_gate.probe_interval_ms,
+        enabled=config.energy_gate.enabled,
+    )
+
+
+def build_detector(config: Config, capture):
+    from src.wakeword.oww_wakeword import OpenWakeWordDetector
+    chunk_ms = config.wakeword.chunk_size * 1000 // capture.sample_rate
+    return OpenWakeWordDetector(
+        capture,
+        model_name=config.wakeword.model_name,
+        threshold=config.wakeword.threshold,
+        chunk_size=config.wakeword.chunk_size,
+        preroll_ms=config.wakeword.preroll_ms,
+        gate=build_energy_gate(config, chunk_ms),
+    )
+
+
+def load_in_parallel(builders: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Run independent component builders concurrently and log their load times.
+
+    Model loading is a mix of file I/O and native code that releases the GIL,
+    so threads overlap well. The first builder error is re-raised.
+    """
+    def _timed(builder):
+        start = time.perf_counter()
+        component = builder()
+        return component, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(builders), thread_name_prefix="load") as pool:
+        futures = {name: pool.submit(_timed, builder) for name, builder in builders.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    wall = time.perf_counter() - start
+
+    report = "\n".join(f"  {name:<10}{seconds:>7.2f}s" for name, (_, seconds) in results.items())
+    serial = sum(seconds for _, seconds in results.values())
+    logger.info(f"Loaded components in {wall:.2f}s (sequential would be ~{serial:.2f}s):\n{report}")
+    return {name: component for name, (component, _) in results.items()}
+
+
+def warm_up(engines: dict[str, Any], runs: int = 2):
+    """Push synthetic input through each engine so the first real turn is fast.
+
+    Logs the first (cold) call against the best later (warm) call per engine.
+    """
+    lines = []
+    for name, engine in engines.items():
+        timings = []
+        for _ in range(max(1, runs)):
+            start = time.perf_counter()
+            engine.warmup()
+            timings.append(time.perf_counter() - start)
+        warm = f"{min(timings[1:]) * 1000:>8.0f} ms" if len(timings) > 1 else "       -"
+        lines.append(f"  {name:<10}cold {timings[0] * 1000:>8.0f} ms   warm {warm}")
+    logger.info("Warm-up complete:\n" + "\n".join(lines))
+
+
+def build_source(config: Config, path: str | None, realtime: bool = True):
+    """File replay source for --audio-in, or None for the microphone."""
+    if not path:
+        return None
+    from src.audio.sources import FileSource
+    return FileSource(path, sample_rate=config.audio.sample_rate,
+                      chunk_size=config.audio.chunk_size, realtime=realtime,
+                      raw_rate=config.audio.device_sample_rate)
+
+
+def build_player(config: Config, output: str | None = None, realtime: bool = True):
+    """Speaker by default; "null" discards audio, any other value is a WAV path."""
+    if output == "null":
+        from src.audio.sinks import NullPlayer
+        return NullPlayer(realtime=realtime)
+    if output:
+        from src.audio.sinks import RecordingPlayer
+        return RecordingPlayer(output, realtime=realtime)
+    from src.audio.player import AudioPlayer
+    return AudioPlayer(device_rate=config.audio.output_sample_rate)
+
+
+def build_components(config: Config, wakeword: bool = False, source=None, player=None):
+    # Imported here so the STT/LLM/TTS builders stay usable on hosts without
+    # audio devices (e.g. the offline benchmark).
+    from src.audio.recorder import AudioRecorder
+
+    recorder = AudioRecorder(
+        sample_rate=config.audio.sample_rate,
+        channels=config.audio.channels,
+        chunk_size=config.audio.chunk_size,
+        device_rate=config.audio.device_sample_rate,
+        source=source,
+    )
+    player = player or build_player(config)
+
+    builders = {
+        "stt": lambda: build_stt(config),
+        "llm": lambda: build_llm(config),
+        "tts": lambda: build_tts(config),
+    }
+    if wakeword:
+        builders["wakeword"] = lambda: build_detector(config, recorder.capture)
+    loaded = load_in_parallel(builders)
+
+    if config.warmup.enabled:
+        warm_up({name: engine for name, engine in loaded.items() if name != "llm"},
+                runs=config.warmup.runs)
+
+    return (recorder, player, loaded["stt"], loaded["llm"], loaded["tts"],
+            loaded.get("wakeword"))
+
+
+def build_tracer(config: Config, event_bus: EventBus, mode: str,
+                 recorder=None, player=None) -> LatencyTracer | None:
+    if not config.tracing.enabled:
+        return None
+
+    def audio_stats() -> dict[str, dict]:
+        return {**recorder.capture.stats(), "playback": player.stats.snapshot()}
+
+    return LatencyTracer(
+        event_bus,
+        mode=mode,
+        path=config.tracing.path,
+        max_bytes=config.tracing.max_bytes,
+        backup_count=config.tracing.backup_count,
+        audio_stats=audio_stats if recorder and player else None,
+    )
+
+
+def _mark(trace, stage: str):
+    if trace is not None:
+        trace.mark(stage)
+
+
+def run_push_to_talk(config: Config, event_bus: EventBus, source=None, player=None):
     """Push-to-talk mode: press Enter to start/stop recording."""
-    recorder, player, stt, llm, tts = build_components(config)
+    recorder, player, stt, llm, tts, _ = build_components(config, source=source, player=player)
+    pipeline = TurnPipeline(llm, tts, player, event_bus)
+    tracer = build_tracer(config, event_bus, "push-to-talk", recorder, player)
 
     logger.info("Push-to-talk mode. Press Enter to record, Enter to stop.")
     logger.info("Type 'quit' to exit, 'reset' to clear conversation.\n")
@@ -68,8 +263,14 @@ def run_push_to_talk(config: Config, event_bus: EventBus):
                 continue
 
             # Record audio
+            trace = tracer.start_turn() if tracer else None
+            _mark(trace, "capture_start")
             event_bus.emit("status_changed", {"status": "recording"})
-            audio = recorder.record_until_enter()
+            audio = recorder.record_until_enter(
+                spill_to_disk=config.audio.long_capture,
+                spill_dir=config.audio.spill_dir,
+            )
+            _mark(trace, "endpoint")
             if len(audio) == 0:
                 print("No audio recorded.")
                 event_bus.emit("status_changed", {"status": "idle"})
@@ -78,7 +279,9 @@ def run_push_to_talk(config: Config, event_bus: EventBus):
             # Transcribe
             event_bus.emit("status_changed", {"status": "transcribing"})
             print("Transcribing...")
+            _mark(trace, "stt_start")
             text = stt.transcribe(audio, config.audio.sample_rate)
+            _mark(trace, "stt_end")
             if not text:
                 print("Could not transcribe audio.")
                 event_bus.emit("status_changed", {"status": "idle"})
@@ -86,60 +289,96 @@ def run_push_to_talk(config: Config, event_bus: EventBus):
             print(f"You said: {text}")
             event_bus.emit("user_message", {"text": text})
 
-            # Get LLM response
+            # Stream the LLM response through TTS to the speaker
             event_bus.emit("status_changed", {"status": "thinking"})
             print("Thinking...")
-            response = llm.respond(text)
+            response = pipeline.run(text, trace)
             print(f"Jarvis: {response}")
             event_bus.emit("assistant_message", {"text": response})
-
-            # Speak response
-            event_bus.emit("status_changed", {"status": "speaking"})
-            print("Speaking...")
-            chunks = tts.synthesize_stream(response)
-            player.play_stream(chunks, tts.get_sample_rate())
             event_bus.emit("status_changed", {"status": "idle"})
+            if tracer:
+                tracer.finish(trace)
 
     except KeyboardInterrupt:
         print("\nGoodbye!")
     finally:
+        if tracer:
+            tracer.log_summary()
+        stt.close()
+        player.close()
         recorder.close()
 
 
-def run_always_listening(config: Config, event_bus: EventBus):
+def run_always_listening(config: Config, event_bus: EventBus, source=None, player=None):
     """Always-listening mode: wake word triggers a multi-turn conversation."""
-    from src.wakeword.oww_wakeword import OpenWakeWordDetector
-
-    recorder, player, stt, llm, tts = build_components(config)
-
-    detector = OpenWakeWordDetector(
-        model_name=config.wakeword.model_name,
-        threshold=config.wakeword.threshold,
-        chunk_size=config.wakeword.chunk_size,
-        sample_rate=config.audio.sample_rate,
-    )
+    recorder, player, stt, llm, tts, detector = build_components(
+        config, wakeword=True, source=source, player=player)
+    pipeline = TurnPipeline(llm, tts, player, event_bus)
+    tracer = build_tracer(config, event_bus, "always-listening", recorder, player)
 
     logger.info(f"Always-listening mode. Say '{config.wakeword.model_name}' to activate.")
     logger.info("Press Ctrl+C to exit.\n")
     event_bus.emit("status_changed", {"status": "idle"})
 
+    monitor = None
+    if config.barge_in.enabled:
+        from src.audio.barge_in import BargeInMonitor
+        monitor = BargeInMonitor(
+            recorder.capture,
+            vad=build_vad(config, aggressiveness=config.barge_in.aggressiveness),
+            frame_duration_ms=config.vad.frame_duration_ms,
+            min_speech_ms=config.barge_in.min_speech_ms,
+        )
+
+    from src.audio.endpointer import Endpointer
+    endpointer = Endpointer(
+        frame_duration_ms=config.vad.frame_duration_ms,
+        silence_timeout=config.vad.silence_timeout,
+        min_silence=config.vad.min_silence_timeout,
+        max_silence=config.vad.max_silence_timeout,
+        adaptive=config.vad.adaptive_endpointing,
+    )
+    vad = build_vad(config)
+    vad_gate = build_energy_gate(config, config.vad.frame_duration_ms)
+    streamer = None
+    if config.whisper.streaming:
+        from src.stt.streaming import StreamingTranscriber
+        streamer = StreamingTranscriber(
+            stt,
+            sample_rate=config.audio.sample_rate,
+            interval_ms=config.whisper.stream_interval_ms,
+            event_bus=event_bus,
+        )
+
     listen_window = 5.0  # seconds to wait for speech each iteration
     idle_limit = 30.0    # total silence before returning to wake word mode
 
-    def on_wake_word():
+    def on_wake_word(wake_position: int):
         logger.info("Wake word detected! Entering conversation mode...")
         event_bus.emit("status_changed", {"status": "wake"})
         cumulative_silence = 0.0
+        # The first command starts right after the wake word, possibly in the
+        # same breath, so read it from the ring instead of from live audio.
+        start_position = wake_position
 
         while True:
-            # Record with VAD, using a short listen window
+            # Record with VAD, using a short listen window. After a barge-in,
+            # resume from the captured speech onset so nothing is lost.
             event_bus.emit("status_changed", {"status": "listening"})
+            trace = tracer.start_turn() if tracer else None
+            _mark(trace, "capture_start")
             audio = recorder.record_with_vad(
-                aggressiveness=config.vad.aggressiveness,
+                vad=vad,
                 silence_timeout=config.vad.silence_timeout,
                 frame_duration_ms=config.vad.frame_duration_ms,
                 listen_timeout=listen_window,
+                start_position=start_position,
+                trace=trace,
+                endpointer=endpointer,
+                gate=vad_gate,
+                streamer=streamer,
             )
+            start_position = None
 
             if len(audio) == 0:
                 cumulative_silence += listen_window
@@ -156,23 +395,31 @@ def run_always_listening(config: Config, event_bus: EventBus):
 
             # Transcribe
             event_bus.emit("status_changed", {"status": "transcribing"})
-            text = stt.transcribe(audio, config.audio.sample_rate)
+            _mark(trace, "stt_start")
+            if streamer and streamer.active:
+                text = streamer.finish(audio)
+            else:
+                text = stt.transcribe(audio, config.audio.sample_rate)
+            _mark(trace, "stt_end")
             if not text:
                 logger.info("Could not transcribe audio.")
                 continue
             print(f"You said: {text}")
             event_bus.emit("user_message", {"text": text})
 
-            # Get LLM response
+            # Stream the LLM response through TTS to the speaker
             event_bus.emit("status_changed", {"status": "thinking"})
-            response = llm.respond(text)
+            if monitor:
+                monitor.start(pipeline.cancel)
+            try:
+                response = pipeline.run(text, trace)
+            finally:
+                if monitor:
+                    start_position = monitor.stop()
             print(f"Jarvis: {response}")
             event_bus.emit("assistant_message", {"text": response})
-
-            # Speak response
-            event_bus.emit("status_changed", {"status": "speaking"})
-            chunks = tts.synthesize_stream(response)
-            player.play_stream(chunks, tts.get_sample_rate())
+            if tracer:
+                tracer.finish(trace)
 
         # Exiting conversation — reset history for next activation
         llm.reset_conversation()
@@ -185,7 +432,11 @@ def run_always_listening(config: Config, event_bus: EventBus):
     except KeyboardInterrupt:
         print("\nGoodbye!")
     finally:
+        if tracer:
+            tracer.log_summary()
         detector.close()
+        stt.close()
+        player.close()
         recorder.close()
 
 
@@ -208,6 +459,21 @@ def main():
         default=False,
         help="Enable web UI (default: disabled)",
     )
+    parser.add_argument(
+        "--audio-in",
+        metavar="PATH",
+        help="Replay a 16-bit WAV or raw PCM file instead of the microphone",
+    )
+    parser.add_argument(
+        "--audio-out",
+        metavar="null|PATH",
+        help="Discard speech output ('null') or write it to a WAV file instead of the speaker",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Replay --audio-in as fast as it is consumed and don't pace --audio-out",
+    )
     args = parser.parse_args()
 
     try:
@@ -224,10 +490,13 @@ def main():
 
     logger.info(f"Starting EchoVault in {args.mode} mode...")
 
+    source = build_source(config, args.audio_in, realtime=not args.fast)
+    player = build_player(config, args.audio_out, realtime=not args.fast) if args.audio_out else None
+
     if args.mode == "push-to-talk":
-        run_push_to_talk(config, event_bus)
+        run_push_to_talk(config, event_bus, source, player)
     else:
-        run_always_listening(config, event_bus)
+        run_always_listening(config, event_bus, source, player)
 
 
 if __name__ == "__main__":
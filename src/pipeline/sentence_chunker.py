@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import re
+from typing import Iterator
+
+# Sentence end: terminal punctuation (optionally followed by closing quotes or
+# brackets) and then whitespace. Requiring the trailing whitespace means we
+# never split "3.14" or a URL while the next token is still in flight.
+_BOUNDARY = re.compile(r"[.!?]+[\"')\]]*\s+|\n+")
+
+_ABBREVIATIONS = {
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "jr.", "st.", "vs.",
+    "etc.", "e.g.", "i.e.", "approx.", "no.",
+}
+
+
+class SentenceChunker:
+    """Split a stream of LLM text deltas into speakable sentences."""
+
+    def __init__(self, min_chars: int = 12):
+        self._min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, delta: str) -> Iterator[str]:
+        """Add a text delta and yield every sentence it completes."""
+        self._buffer += delta
+        start = 0
+        for match in _BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()].strip()
+            if len(candidate) < self._min_chars or self._ends_with_abbreviation(candidate):
+                continue
+            yield candidate
+            start = match.end()
+        self._buffer = self._buffer[start:]
+
+    def flush(self) -> Iterator[str]:
+        """Yield whatever text remains once the stream has ended."""
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        if remainder:
+            yield remainder
+
+    @staticmethod
+    def _ends_with_abbreviation(text: str) -> bool:
+        last_word = text.rsplit(None, 1)[-1].lower()
+        return last_word in _ABBREVIATIONS
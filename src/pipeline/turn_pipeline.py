@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING, Iterator
+
+from src.llm.base import BaseLLM
+from src.pipeline.sentence_chunker import SentenceChunker
+from src.tts.base import BaseTTS
+from src.ui.event_bus import EventBus
+from src.utils.logger import setup_logger
+from src.utils.tracing import TurnTrace
+
+if TYPE_CHECKING:
+    from src.audio.player import AudioPlayer
+
+logger = setup_logger(__name__)
+
+_END = None  # queue sentinel
+
+
+class TurnPipeline:
+    """Run one assistant turn with LLM, TTS and playback overlapped.
+
+    LLM deltas are split into sentences on the calling thread. A synthesis
+    thread turns each sentence into audio chunks that a playback thread streams
+    to the speaker as they arrive, so the first sentence is heard while later
+    ones are still being generated.
+
+    ``cancel()`` may be called from any thread (e.g. on barge-in): it stops
+    playback immediately, skips synthesis of the remaining sentences and aborts
+    the LLM stream, so a read blocked on the network returns right away.
+    """
+
+    def __init__(self, llm: BaseLLM, tts: BaseTTS, player: AudioPlayer,
+                 event_bus: EventBus | None = None):
+        self._llm = llm
+        self._tts = tts
+        self._player = player
+        self._event_bus = event_bus
+        self._cancel = threading.Event()
+        self._trace: TurnTrace | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        """Interrupt the running turn as quickly as possible."""
+        self._cancel.set()
+        self._player.stop()
+        self._llm.abort()
+
+    def run(self, user_text: str, trace: TurnTrace | None = None) -> str:
+        """Speak the reply to user_text and return the text that was generated."""
+        self._cancel.clear()
+        self._trace = trace
+        sentences: queue.Queue[str | None] = queue.Queue()
+        audio: queue.Queue[bytes | None] = queue.Queue()
+        errors: list[BaseException] = []
+
+        workers = [
+            threading.Thread(target=self._guard(self._synthesize, errors),
+                             args=(sentences, audio), daemon=True),
+            threading.Thread(target=self._guard(self._playback, errors),
+                             args=(audio,), daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+
+        chunker = SentenceChunker()
+        parts: list[str] = []
+        deltas = self._llm.respond_stream(user_text)
+        try:
+            for delta in deltas:
+                if self._cancel.is_set():
+                    break
+                if not parts:
+                    self._mark("llm_first_token")
+                parts.append(delta)
+                if self._event_bus:
+                    self._event_bus.emit("assistant_delta", {"text": delta})
+                for sentence in chunker.feed(delta):
+                    sentences.put(sentence)
+            for sentence in chunker.flush():
+                sentences.put(sentence)
+            self._mark("llm_last_token")
+        finally:
+            deltas.close()
+            sentences.put(_END)
+            for worker in workers:
+                worker.join()
+
+        if errors:
+            raise errors[0]
+        return "".join(parts)
+
+    def _synthesize(self, sentences: queue.Queue, audio: queue.Queue):
+        try:
+            for sentence in iter(sentences.get, _END):
+                if self._cancel.is_set():
+                    continue
+                for chunk in self._tts.synthesize_stream(sentence):
+                    if self._cancel.is_set():
+                        break
+                    self._mark("tts_first_chunk")
+                    audio.put(chunk)
+        finally:
+            audio.put(_END)
+
+    def _playback(self, audio: queue.Queue):
+        self._player.play_stream(self._announce(iter(audio.get, _END)),
+                                 self._tts.get_sample_rate())
+        if self._player.first_audio_time is not None:
+            self._mark("first_audio_out", at=self._player.first_audio_time)
+        self._mark("playback_end")
+
+    def _mark(self, stage: str, at: float | None = None):
+        if self._trace is not None:
+            self._trace.mark(stage, at)
+
+    def _announce(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        first = True
+        for chunk in chunks:
+            if self._cancel.is_set():
+                break
+            if first and self._event_bus:
+                self._event_bus.emit("status_changed", {"status": "speaking"})
+            first = False
+            yield chunk
+
+    @staticmethod
+    def _guard(target, errors: list[BaseException]):
+        def _run(*args):
+            try:
+                target(*args)
+            except BaseException as e:  # surfaced on the calling thread
+                logger.error(f"Turn pipeline stage failed: {e}")
+                errors.append(e)
+        return _run
@@ -8,3 +8,9 @@ class BaseSTT(ABC):
     def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
         """Transcribe audio to text."""
         ...
+
+    def warmup(self) -> None:
+        """Run a short synthetic input to initialize lazy state. No-op by default."""
+
+    def close(self) -> None:
+        """Release worker processes or other resources. No-op by default."""
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+from faster_whisper import WhisperModel
+
+from src.audio.resampler import resample
+from src.stt.base import BaseSTT
+from src.stt.segmenter import split_at_quiet_points
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class FasterWhisperSTT(BaseSTT):
+    """Whisper on CTranslate2 (faster-whisper), int8-quantized by default.
+
+    On CPU-only hosts this avoids openai-whisper's fp32 PyTorch path: weights
+    are quantized at load time according to ``compute_type`` ("int8",
+    "int8_float32", "int8_float16", "float16", "float32"), and inference uses
+    ``cpu_threads`` threads (0 = CTranslate2's default). ``language`` ("" =
+    detect) and the decoding options mirror ``WhisperSTT``'s.
+
+    Like ``WhisperSTT``, recordings longer than ``block_seconds`` are
+    transcribed block by block, cut at quiet points and prompted with the
+    previous block's text, so only one block is ever converted to float32.
+    """
+
+    def __init__(self, model_name: str = "turbo", device: str = "auto",
+                 compute_type: str = "int8", cpu_threads: int = 0,
+                 block_seconds: float = 600.0,
+                 language: str = "en", beam_size: int = 1, best_of: int = 5,
+                 temperature: tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+                 condition_on_previous_text: bool = True, without_timestamps: bool = False):
+        if device in ("auto", "mps"):
+            # CTranslate2 has no Metal backend; "auto" picks CUDA when available.
+            device = "auto" if device == "auto" else "cpu"
+        self._block_seconds = block_seconds
+        self._language = language or None
+        self._decode_options = {
+            "beam_size": beam_size,
+            "best_of": best_of,
+            "temperature": list(temperature),
+            "condition_on_previous_text": condition_on_previous_text,
+            "without_timestamps": without_timestamps,
+        }
+        logger.info(f"Loading faster-whisper model '{model_name}' ({compute_type}, {device})...")
+        self._model = WhisperModel(model_name, device=device, compute_type=compute_type,
+                                   cpu_threads=cpu_threads)
+        logger.info("faster-whisper model loaded.")
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
+        if len(audio) <= self._block_seconds * sample_rate:
+            text = self._transcribe_block(audio, sample_rate)
+        else:
+            spans = split_at_quiet_points(audio, sample_rate, self._block_seconds)
+            logger.info(f"Transcribing {len(audio) / sample_rate / 60:.1f} min "
+                        f"in {len(spans)} blocks...")
+            parts: list[str] = []
+            for start, end in spans:
+                prompt = " ".join(parts)[-200:] or None
+                parts.append(self._transcribe_block(audio[start:end], sample_rate, prompt))
+            text = " ".join(part for part in parts if part)
+        logger.debug(f"Transcription: {text}")
+        return text
+
+    def _transcribe_block(self, audio: np.ndarray, sample_rate: int,
+                          prompt: str | None = None) -> str:
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) / 32768.0
+        audio = resample(audio, sample_rate, 16000)
+
+        segments, _ = self._model.transcribe(audio, language=self._language,
+                                             initial_prompt=prompt, **self._decode_options)
+        # Segments are decoded lazily as the generator is consumed.
+        return "".join(segment.text for segment in segments).strip()
+
+    def warmup(self) -> None:
+        noise = np.random.default_rng(0).normal(0, 0.01, 16000).astype(np.float32)
+        self.transcribe(noise, 16000)
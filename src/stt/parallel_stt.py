@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.stt.base import BaseSTT
+from src.stt.segmenter import split_at_pauses
+from src.utils.logger import setup_logger
+from src.vad.base import BaseVAD
+
+logger = setup_logger(__name__)
+
+# One model per worker process, loaded by the pool initializer.
+_worker_stt = None
+_worker_barrier = None
+
+
+def _init_worker(model_name: str, threads: int, options: dict, barrier):
+    import torch
+
+    from src.stt.whisper_stt import WhisperSTT
+
+    global _worker_stt, _worker_barrier
+    _worker_barrier = barrier
+    torch.set_num_threads(threads)
+    _worker_stt = WhisperSTT(model_name=model_name, device="cpu", **options)
+    _worker_stt.warmup()
+
+
+def _transcribe_segment(audio: np.ndarray, sample_rate: int) -> str:
+    return _worker_stt.transcribe(audio, sample_rate)
+
+
+def _ready(_: int) -> int:
+    # Hold this worker until every worker has a task, so each takes one.
+    _worker_barrier.wait()
+    return os.getpid()
+
+
+class ParallelWhisperSTT(BaseSTT):
+    """CPU Whisper that transcribes pause-delimited segments across processes.
+
+    ``whisper.transcribe`` walks its input in sequential 30 s windows on one
+    thread pool, so a long recording keeps only a few cores busy. Here the
+    audio is cut at speech pauses into segments of at most
+    ``segment_seconds``, the segments are transcribed concurrently by a
+    process pool with one model copy per worker (``workers`` x model RAM),
+    and the texts are joined back in order. Segments do not see each other's
+    text, so a word split across a cut without a pause may be garbled.
+
+    Short recordings become a single segment on one worker, which has only
+    ``threads_per_worker`` threads, so this backend suits long recordings
+    on many-core servers rather than quick voice commands.
+
+    Pauses are found with ``vad`` (int16 audio at ``vad_sample_rate``, in
+    ``vad_frame_ms`` frames); other audio, or no VAD, falls back to an energy
+    heuristic. Extra keyword arguments (language, decoding options) go to
+    each worker's ``WhisperSTT``.
+
+    The constructor blocks until every worker has loaded and warmed its
+    model, so the first utterance does not pay for the model loads.
+    """
+
+    def __init__(self, model_name: str = "turbo", workers: int = 0,
+                 threads_per_worker: int = 0, segment_seconds: float = 30.0,
+                 vad: BaseVAD | None = None, vad_sample_rate: int = 16000,
+                 vad_frame_ms: int = 30, **whisper_options):
+        cores = os.cpu_count() or 1
+        self._workers = workers or max(1, cores // max(1, threads_per_worker or 2))
+        threads = threads_per_worker or max(1, cores // self._workers)
+        self._segment_seconds = segment_seconds
+        self._vad = vad
+        self._vad_sample_rate = vad_sample_rate
+        self._vad_frame_ms = vad_frame_ms
+        logger.info(f"Starting {self._workers} Whisper '{model_name}' workers "
+                    f"({threads} threads each)...")
+        # spawn: torch and OpenMP thread pools do not survive fork.
+        context = multiprocessing.get_context("spawn")
+        self._pool = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(model_name, threads, whisper_options, context.Barrier(self._workers)),
+        )
+        # The pool spawns a worker per task submitted while none is idle, and
+        # each loads and warms its model before taking a task. One task per
+        # worker, blocked on a shared barrier, cannot be drained by early ones.
+        pids = set(self._pool.map(_ready, range(self._workers)))
+        logger.info(f"{len(pids)} Whisper workers ready.")
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
+        use_vad = sample_rate == self._vad_sample_rate and audio.dtype == np.int16
+        spans = split_at_pauses(audio, sample_rate, self._segment_seconds,
+                                vad=self._vad if use_vad else None,
+                                frame_ms=self._vad_frame_ms)
+        start = time.perf_counter()
+        # np.asarray pickles plain arrays even when audio is a memmap.
+        futures = [self._pool.submit(_transcribe_segment, np.asarray(audio[a:b]), sample_rate)
+                   for a, b in spans]
+        text = " ".join(part for part in (f.result() for f in futures) if part)
+        if len(spans) > 1:
+            logger.info(f"Transcribed {len(audio) / sample_rate:.0f}s as {len(spans)} segments "
+                        f"on {self._workers} workers in {time.perf_counter() - start:.1f}s.")
+        logger.debug(f"Transcription: {text}")
+        return text
+
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+
+from src.vad.base import BaseVAD
+
+_BLOCK_FRAMES = 2000  # frames per energy pass, to bound float copies of long input
+
+
+def _frame_energy(audio: np.ndarray, frame: int, start: int = 0, stop: int | None = None) -> np.ndarray:
+    """Sum of squares per frame over audio[start:stop], computed in blocks."""
+    stop = len(audio) if stop is None else stop
+    count = (stop - start) // frame
+    energy = np.empty(count, dtype=np.float32)
+    for first in range(0, count, _BLOCK_FRAMES):
+        last = min(first + _BLOCK_FRAMES, count)
+        block = np.asarray(audio[start + first * frame:start + last * frame], dtype=np.float32)
+        block = block.reshape(-1, frame)
+        energy[first:last] = np.einsum("ij,ij->i", block, block)
+    return energy
+
+
+def _quietest_cut(audio: np.ndarray, start: int, stop: int, frame: int) -> int:
+    energy = _frame_energy(audio, frame, start, stop)
+    return start + int(np.argmin(energy)) * frame + frame // 2
+
+
+def split_at_quiet_points(audio: np.ndarray, sample_rate: int, max_seconds: float,
+                          search_seconds: float = 5.0,
+                          frame_ms: int = 30) -> list[tuple[int, int]]:
+    """Cut audio into spans of at most max_seconds at the quietest nearby frame.
+
+    Each cut is placed at the lowest-energy frame within the last
+    search_seconds before the limit, so words are rarely split. Only those
+    search windows are read, which keeps this cheap on memory-mapped input.
+    """
+    limit = int(max_seconds * sample_rate)
+    search = min(int(search_seconds * sample_rate), limit // 2)
+    frame = max(1, sample_rate * frame_ms // 1000)
+    spans = []
+    start = 0
+    while len(audio) - start > limit:
+        cut = _quietest_cut(audio, start + limit - search, start + limit, frame)
+        spans.append((start, cut))
+        start = cut
+    spans.append((start, len(audio)))
+    return spans
+
+
+def split_at_pauses(audio: np.ndarray, sample_rate: int, max_seconds: float,
+                    min_pause_ms: int = 300, vad: BaseVAD | None = None,
+                    frame_ms: int = 30) -> list[tuple[int, int]]:
+    """Cut audio into spans of at most max_seconds in the middle of speech pauses.
+
+    Pauses are runs of at least min_pause_ms of non-speech. Frames are
+    classified by vad when given, otherwise as speech when they are more than
+    10 dB (or half the dynamic range, if smaller) above the recording's noise
+    floor, taken as its 2nd-percentile frame level.
+    Each span ends at the last pause that fits; a stretch with no pause falls
+    back to the quietest frame near the limit.
+    """
+    frame = max(1, sample_rate * frame_ms // 1000)
+    limit = int(max_seconds * sample_rate)
+    if len(audio) <= limit:
+        return [(0, len(audio))]
+
+    if vad is not None:
+        vad.reset()
+        speech = np.array([vad.is_speech(np.asarray(audio[i * frame:(i + 1) * frame]))
+                           for i in range(len(audio) // frame)], dtype=bool)
+    else:
+        level = 10 * np.log10(_frame_energy(audio, frame) / frame + 1.0)
+        floor, loud = np.percentile(level, [2, 95])
+        speech = level > floor + min(10.0, (loud - floor) / 2)
+
+    # Midpoints of non-speech runs long enough to count as pauses.
+    edges = np.diff(np.concatenate(([1], speech.astype(np.int8), [1])))
+    run_starts = np.flatnonzero(edges == -1)
+    run_ends = np.flatnonzero(edges == 1)
+    long_enough = (run_ends - run_starts) * frame_ms >= min_pause_ms
+    cuts = ((run_starts + run_ends)[long_enough] * frame) // 2
+
+    spans = []
+    start = 0
+    while len(audio) - start > limit:
+        fitting = cuts[(cuts > start) & (cuts <= start + limit)]
+        if len(fitting):
+            cut = int(fitting[-1])
+        else:
+            search = min(5 * sample_rate, limit // 2)
+            cut = _quietest_cut(audio, start + limit - search, start + limit, frame)
+        spans.append((start, cut))
+        start = cut
+    spans.append((start, len(audio)))
+    return spans
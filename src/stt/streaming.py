@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+
+from src.audio.sample_buffer import SampleBuffer
+from src.stt.base import BaseSTT
+from src.stt.segmenter import split_at_quiet_points
+from src.ui.event_bus import EventBus
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _common_prefix(a: list[str], b: list[str]) -> list[str]:
+    count = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        count += 1
+    return a[:count]
+
+
+class StreamingTranscriber:
+    """Transcribe an utterance incrementally while it is still being recorded.
+
+    ``record_with_vad`` calls ``start`` at speech onset and ``observe`` for
+    every recorded frame. A background thread then, every ``interval_ms``:
+
+    * if the speaker has paused for ``min_pause_ms`` since the open window
+      began, decodes the window up to the middle of that pause once and
+      commits the text; that audio cannot change, so the window moves past it;
+    * otherwise re-decodes the growing window and applies local agreement:
+      words that two consecutive decodes agree on are reported as stable,
+      the rest as tentative.
+
+    Each update is published as ``partial_transcript`` with ``text``
+    (committed + stable) and ``tentative``. A window longer than
+    ``max_window_s`` without a pause is cut at its quietest frame. At the
+    endpoint ``finish`` decodes only the audio after the last commit, which
+    the trailing silence usually leaves empty or short; if the last window
+    decode already reached the end of speech, its text is reused as is.
+    """
+
+    def __init__(self, stt: BaseSTT, sample_rate: int = 16000, interval_ms: int = 500,
+                 min_pause_ms: int = 300, max_window_s: float = 20.0,
+                 event_bus: EventBus | None = None):
+        self._stt = stt
+        self._sample_rate = sample_rate
+        self._interval = interval_ms / 1000
+        self._min_pause = int(sample_rate * min_pause_ms / 1000)
+        self._max_window = int(sample_rate * max_window_s)
+        self._event_bus = event_bus
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reset(None)
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None
+
+    def start(self, buffer: SampleBuffer):
+        """Begin decoding buffer, which holds the utterance from speech onset."""
+        self._reset(buffer)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def observe(self, length: int, is_speech: bool):
+        """Record that buffer now holds length samples, the last frame (non-)speech."""
+        with self._lock:
+            if is_speech:
+                self._speech_end = length
+                self._pause_start = None
+            elif self._pause_start is None:
+                self._pause_start = self._length
+            elif length - self._pause_start >= self._min_pause and self._speech_end > self._window_start:
+                self._cut = self._pause_start + self._min_pause // 2
+            self._length = length
+
+    def finish(self, audio: np.ndarray) -> str:
+        """Stop streaming and return the full transcript of audio."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        start = time.perf_counter()
+        tail = ""
+        decoded = 0.0
+        if self._speech_end > self._window_start and len(audio) > self._window_start:
+            if self._decoded is not None and self._decoded[0] == self._window_start \
+                    and self._decoded[1] >= self._speech_end:
+                # Only silence was recorded after the last window decode.
+                tail = self._decoded[2]
+            else:
+                tail = self._stt.transcribe(audio[self._window_start:], self._sample_rate)
+                decoded = (len(audio) - self._window_start) / self._sample_rate
+        text = " ".join(part for part in [*self._committed, tail] if part)
+        logger.info(f"Streaming STT: {len(self._committed)} segment(s) committed during capture, "
+                    f"{decoded:.1f}s decoded after the endpoint "
+                    f"in {time.perf_counter() - start:.2f}s.")
+        self._reset(None)
+        return text
+
+    def _reset(self, buffer: SampleBuffer | None):
+        self._buffer = buffer
+        self._length = 0
+        self._speech_end = 0
+        self._pause_start: int | None = None
+        self._cut: int | None = None
+        self._window_start = 0
+        self._committed: list[str] = []
+        self._previous: list[str] = []
+        # (window start, length, text) of the last full-window decode.
+        self._decoded: tuple[int, int, str] | None = None
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            try:
+                self._step()
+            except Exception:
+                logger.exception("Streaming transcription step failed.")
+                return
+
+    def _step(self):
+        with self._lock:
+            cut, length, speech_end = self._cut, self._length, self._speech_end
+            self._cut = None
+        start = self._window_start
+        if speech_end <= start or length - start < self._sample_rate // 2:
+            return
+        window = np.array(self._buffer.view()[start:length])
+
+        if cut is None and len(window) > self._max_window:
+            cut = start + split_at_quiet_points(window, self._sample_rate,
+                                                self._max_window / self._sample_rate)[0][1]
+        if cut is not None and cut > start:
+            text = self._stt.transcribe(window[:cut - start], self._sample_rate)
+            if text:
+                self._committed.append(text)
+            self._window_start = cut
+            self._previous = []
+            self._emit([])
+            return
+
+        text = self._stt.transcribe(window, self._sample_rate)
+        self._decoded = (start, length, text)
+        words = text.split()
+        stable = _common_prefix(self._previous, words)
+        self._previous = words
+        self._emit(words, len(stable))
+
+    def _emit(self, words: list[str], stable: int = 0):
+        if self._event_bus is None:
+            return
+        text = " ".join([*self._committed, *words[:stable]])
+        self._event_bus.emit("partial_transcript",
+                             {"text": text, "tentative": " ".join(words[stable:])})
@@ -13,10 +13,18 @@ logger = setup_logger(__name__)
 
 
 class WhisperAPISTT(BaseSTT):
-    """STT backend that uses the OpenAI Whisper API instead of running locally."""
-
-    def __init__(self, api_key: str):
-        self._client = OpenAI(api_key=api_key)
+    """STT backend that uses the OpenAI Whisper API instead of running locally.
+
+    The API has no beam or fallback settings: it takes ``language`` ("" =
+    detect) and one ``temperature``, and at 0 raises it on its own.
+    """
+
+    def __init__(self, api_key: str, base_url: str = "", language: str = "en",
+                 temperature: float = 0.0):
+        self._client = OpenAI(api_key=api_key, base_url=base_url or None)
+        self._options: dict = {"temperature": temperature}
+        if language:
+            self._options["language"] = language
         logger.info("Using OpenAI Whisper API for speech-to-text.")
 
     def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
@@ -36,7 +44,8 @@ class WhisperAPISTT(BaseSTT):
         result = self._client.audio.transcriptions.create(
             model="whisper-1",
             file=wav_buffer,
+            **self._options,
         )
         text = result.text.strip()
-        logger.info(f"Transcription: {text}")
+        logger.debug(f"Transcription: {text}")
         return text
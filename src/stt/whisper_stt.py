@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import dataclasses
+import os
+import re
+import threading
+from pathlib import Path
+
 import numpy as np
 import torch
 import whisper
+from torch import nn
+from whisper.audio import HOP_LENGTH, N_FRAMES, N_SAMPLES
+from whisper.model import ModelDimensions, Whisper
 
+from src.audio.resampler import resample
 from src.stt.base import BaseSTT
+from src.stt.segmenter import split_at_quiet_points
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -23,11 +34,128 @@ def _resolve_device(device: str) -> tuple[str, bool]:
     return "cpu", False
 
 
+def _quantize(model: Whisper) -> Whisper:
+    """Dynamic int8 quantization of the model's Linear layers (CPU only)."""
+    # whisper.model.Linear is an nn.Linear subclass that casts weights to the
+    # input dtype; quantize_dynamic only swaps modules of exactly nn.Linear.
+    for module in model.modules():
+        if type(module) is whisper.model.Linear:
+            module.__class__ = nn.Linear
+    # In place: the default deep copy would briefly hold two fp32 models.
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8,
+                                                  inplace=True)
+
+
+def _int8_skeleton(dims: ModelDimensions) -> Whisper:
+    """An empty Whisper whose Linear layers are int8 from the start.
+
+    Building ``Whisper(dims)`` and quantizing it would allocate and randomly
+    initialize every fp32 Linear weight only to discard it. whisper.model
+    constructs its layers through the module-level ``Linear``, so that name
+    is pointed at int8 dynamic Linear for the duration. (A meta-device
+    skeleton is not an option: the constructor calls ``to_sparse``, which
+    has no meta kernel.)
+    """
+    def int8_linear(in_features: int, out_features: int, bias: bool = True) -> nn.Module:
+        return torch.ao.nn.quantized.dynamic.Linear(in_features, out_features, bias_=bias,
+                                                    dtype=torch.qint8)
+
+    linear = whisper.model.Linear
+    whisper.model.Linear = int8_linear
+    try:
+        return Whisper(dims)
+    finally:
+        whisper.model.Linear = linear
+
+
+def _load_quantized(model_name: str, cache_dir: str) -> Whisper:
+    """Load an int8 model from cache_dir, quantizing and caching it on first use.
+
+    Packed int8 weights are tied to the torch build, so the cache file is
+    keyed by model name and torch version.
+    """
+    key = re.sub(r"[^\w.-]", "_", model_name)
+    path = Path(cache_dir) / f"{key}-int8-torch{torch.__version__}.pt"
+    if path.exists():
+        # Our own file; packed quantized weights need the full unpickler.
+        checkpoint = torch.load(path, map_location="cpu", weights_only=False)
+        model = _int8_skeleton(ModelDimensions(**checkpoint["dims"]))
+        model.load_state_dict(checkpoint["model_state_dict"])
+        # Non-persistent buffer (word-timestamp heads), saved alongside.
+        model.register_buffer("alignment_heads", checkpoint["alignment_heads"].to_sparse(),
+                              persistent=False)
+        logger.info(f"Loaded int8 Whisper weights from {path}.")
+        return model
+
+    model = _quantize(whisper.load_model(model_name, device="cpu"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    torch.save({
+        "dims": dataclasses.asdict(model.dims),
+        "model_state_dict": model.state_dict(),
+        "alignment_heads": model.alignment_heads.to_dense(),
+    }, tmp)
+    # Parallel workers may quantize at the same time; the last rename wins.
+    os.replace(tmp, path)
+    logger.info(f"Cached int8 Whisper weights at {path}.")
+    return model
+
+
 class WhisperSTT(BaseSTT):
-    def __init__(self, model_name: str = "turbo", device: str = "auto"):
+    """Local Whisper transcription.
+
+    Recordings longer than ``block_seconds`` (e.g. memory-mapped dictation)
+    are transcribed block by block, cut at quiet points, so only one block
+    is ever converted to float32. Each block is prompted with the end of the
+    previous block's text to keep context across cuts.
+
+    ``whisper.transcribe`` pads every input to a 30 s mel window, so a short
+    command costs as much encoder work as a 30 s one. Audio shorter than
+    ``short_seconds`` instead takes a fast path: the encoder runs on a mel
+    trimmed to the audio length (rounded up to whole seconds) with its
+    positional embedding sliced to match, and a single temperature-0 decode
+    runs without timestamps or temperature fallback. ``short_seconds=0``
+    disables it.
+
+    ``language`` ("" = detect) and the remaining decoding options are passed
+    to ``whisper.transcribe``; ``temperature`` is its fallback schedule.
+
+    On CPU, ``quantize=True`` applies dynamic int8 quantization to every
+    Linear layer, cutting their weight memory to a quarter and speeding up
+    the matmuls. The quantized weights are cached in ``cache_dir`` so later
+    starts skip the fp32 checkpoint.
+    """
+
+    def __init__(self, model_name: str = "turbo", device: str = "auto",
+                 block_seconds: float = 600.0, short_seconds: float = 10.0,
+                 language: str = "en", beam_size: int = 1, best_of: int = 5,
+                 temperature: tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+                 condition_on_previous_text: bool = True, without_timestamps: bool = False,
+                 quantize: bool = False, cache_dir: str = "models/whisper-int8"):
+        self._block_seconds = block_seconds
+        self._short_seconds = short_seconds
+        self._language = language or None
+        # openai-whisper runs beam search whenever beam_size is set; None is greedy.
+        self._beam_size = beam_size if beam_size > 1 else None
+        self._decode_options = {
+            "beam_size": self._beam_size,
+            "best_of": best_of,
+            "temperature": temperature,
+            "condition_on_previous_text": condition_on_previous_text,
+            "without_timestamps": without_timestamps,
+        }
+        # The fast path swaps the encoder's positional embedding; every decode
+        # holds this lock so none sees the sliced one.
+        self._encoder_lock = threading.Lock()
         resolved_device, self._fp16 = _resolve_device(device)
-        logger.info(f"Loading Whisper model '{model_name}' on {resolved_device}...")
-        if resolved_device == "mps":
+        if quantize and resolved_device != "cpu":
+            logger.warning(f"int8 quantization is CPU-only; loading fp32 on {resolved_device}.")
+            quantize = False
+        logger.info(f"Loading Whisper model '{model_name}' on {resolved_device}"
+                    f"{' (int8)' if quantize else ''}...")
+        if quantize:
+            self._model = _load_quantized(model_name, cache_dir)
+        elif resolved_device == "mps":
             # MPS doesn't support sparse COO tensors; load on CPU, densify, then move
             model = whisper.load_model(model_name, device="cpu")
             for name, buf in list(model.named_buffers()):
@@ -40,21 +168,71 @@ class WhisperSTT(BaseSTT):
             self._model = model.to("mps")
         else:
             self._model = whisper.load_model(model_name, device=resolved_device)
+        if self._language is None and not self._model.is_multilingual:
+            # .en models cannot detect a language: decode() raises on them.
+            self._language = "en"
         logger.info("Whisper model loaded.")
 
     def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
+        if len(audio) <= self._block_seconds * sample_rate:
+            text = self._transcribe_block(audio, sample_rate)
+        else:
+            spans = split_at_quiet_points(audio, sample_rate, self._block_seconds)
+            logger.info(f"Transcribing {len(audio) / sample_rate / 60:.1f} min "
+                        f"in {len(spans)} blocks...")
+            parts: list[str] = []
+            for start, end in spans:
+                prompt = " ".join(parts)[-200:] or None
+                parts.append(self._transcribe_block(audio[start:end], sample_rate, prompt))
+            text = " ".join(part for part in parts if part)
+        logger.debug(f"Transcription: {text}")
+        return text
+
+    def _transcribe_block(self, audio: np.ndarray, sample_rate: int,
+                          prompt: str | None = None) -> str:
         # Whisper expects float32 in [-1, 1]
         if audio.dtype == np.int16:
             audio = audio.astype(np.float32) / 32768.0
 
-        # Resample to 16kHz if needed (Whisper requires 16kHz)
-        if sample_rate != 16000:
-            duration = len(audio) / sample_rate
-            target_len = int(duration * 16000)
-            indices = np.linspace(0, len(audio) - 1, target_len).astype(int)
-            audio = audio[indices]
+        # Whisper requires 16kHz
+        audio = resample(audio, sample_rate, 16000)
 
-        result = self._model.transcribe(audio, fp16=self._fp16, language="en")
-        text = result["text"].strip()
-        logger.info(f"Transcription: {text}")
-        return text
+        if len(audio) < self._short_seconds * 16000:
+            return self._transcribe_short(audio, prompt)
+        with self._encoder_lock:
+            result = self._model.transcribe(audio, fp16=self._fp16, language=self._language,
+                                            initial_prompt=prompt, **self._decode_options)
+        return result["text"].strip()
+
+    def _transcribe_short(self, audio: np.ndarray, prompt: str | None = None) -> str:
+        """Decode audio (16 kHz float32, under 30 s) with a reduced audio context."""
+        # Same mel as whisper.transcribe (log-scaled against 30 s of padding),
+        # but cut to whole seconds of real audio: 100 frames, 50 encoder positions.
+        mel = whisper.log_mel_spectrogram(audio, self._model.dims.n_mels, padding=N_SAMPLES)
+        frames = -(-len(audio) // HOP_LENGTH)
+        n_frames = min(N_FRAMES, -(-frames // 100) * 100)
+        mel = mel[:, :n_frames].to(self._model.device)
+        if self._fp16:
+            mel = mel.half()
+
+        options = whisper.DecodingOptions(language=self._language, temperature=0.0,
+                                          beam_size=self._beam_size, without_timestamps=True,
+                                          fp16=self._fp16, prompt=prompt)
+        encoder = self._model.encoder
+        with self._encoder_lock:
+            full = encoder.positional_embedding
+            encoder.positional_embedding = full[:n_frames // 2]
+            try:
+                result = self._model.decode(mel, options)
+            finally:
+                encoder.positional_embedding = full
+
+        # whisper.transcribe's silence check: likely no speech, low confidence.
+        if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+            return ""
+        return result.text.strip()
+
+    def warmup(self) -> None:
+        # Low-level noise rather than silence so the decoder runs as well.
+        noise = np.random.default_rng(0).normal(0, 0.01, 16000).astype(np.float32)
+        self.transcribe(noise, 16000)
@@ -21,3 +21,6 @@ class BaseTTS(ABC):
     def get_sample_rate(self) -> int:
         """Return the output sample rate."""
         ...
+
+    def warmup(self) -> None:
+        """Run a short synthetic input to initialize lazy state. No-op by default."""
@@ -35,3 +35,7 @@ class PiperTTS(BaseTTS):
 
     def get_sample_rate(self) -> int:
         return self._sample_rate
+
+    def warmup(self) -> None:
+        for _ in self.synthesize_stream("Hello there."):
+            pass
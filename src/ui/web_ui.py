@@ -30,7 +30,8 @@ def start_web_ui(event_bus: EventBus, host: str = "0.0.0.0", port: int = 5000) -
             socketio.emit(event_name, data)
         return _handler
 
-    for evt in ("status_changed", "user_message", "assistant_message", "conversation_reset"):
+    for evt in ("status_changed", "partial_transcript", "user_message", "assistant_delta",
+                "assistant_message", "conversation_reset"):
         event_bus.on(evt, _forward(evt))
 
     def _run():
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Callable
+
+from src.ui.event_bus import EventBus
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+STAGES = (
+    "capture_start",
+    "speech_onset",
+    "endpoint",
+    "stt_start",
+    "stt_end",
+    "llm_first_token",
+    "llm_last_token",
+    "tts_first_chunk",
+    "first_audio_out",
+    "playback_end",
+)
+
+# Span name -> (start stage, end stage). Spans whose stages were not both
+# marked (e.g. speech_onset in push-to-talk) are left out of the record.
+SPANS = {
+    "listen": ("capture_start", "speech_onset"),
+    "utterance": ("speech_onset", "endpoint"),
+    "stt": ("stt_start", "stt_end"),
+    "llm_first_token": ("stt_end", "llm_first_token"),
+    "llm_stream": ("llm_first_token", "llm_last_token"),
+    "tts_first_chunk": ("llm_first_token", "tts_first_chunk"),
+    "audio_start": ("tts_first_chunk", "first_audio_out"),
+    "playback": ("first_audio_out", "playback_end"),
+    "endpoint_to_first_audio": ("endpoint", "first_audio_out"),
+}
+
+
+class TurnTrace:
+    """Monotonic timestamps for the stages of one conversational turn."""
+
+    def __init__(self, turn_id: int, mode: str):
+        self.turn_id = turn_id
+        self.mode = mode
+        self.wall_time = time.time()
+        self.marks: dict[str, float] = {}
+
+    def mark(self, stage: str, at: float | None = None):
+        """Record a stage timestamp. The first mark of a stage wins."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown trace stage '{stage}'")
+        self.marks.setdefault(stage, time.monotonic() if at is None else at)
+
+    def spans(self) -> dict[str, float]:
+        """Durations in milliseconds for every span with both ends marked."""
+        return {
+            name: (self.marks[end] - self.marks[start]) * 1000
+            for name, (start, end) in SPANS.items()
+            if start in self.marks and end in self.marks
+        }
+
+    def to_dict(self) -> dict:
+        origin = min(self.marks.values(), default=0.0)
+        return {
+            "turn": self.turn_id,
+            "mode": self.mode,
+            "time": self.wall_time,
+            "marks_ms": {
+                stage: round((self.marks[stage] - origin) * 1000, 1)
+                for stage in STAGES if stage in self.marks
+            },
+            "spans_ms": {name: round(ms, 1) for name, ms in self.spans().items()},
+        }
+
+
+# Audio stream counters reported per turn as deltas since the previous turn.
+_AUDIO_COUNTERS = ("overflows", "underflows", "short_reads", "timeouts", "underruns", "dropped")
+
+
+class LatencyTracer:
+    """Collects per-turn traces, publishes them and summarizes on exit.
+
+    Each finished turn is emitted on the event bus as ``turn_trace`` and
+    appended as one JSON line to a size-rotated file. When ``audio_stats`` is
+    given (a callable returning per-stream ``StreamStats`` snapshots), the
+    record also carries each stream's counter deltas for the turn, and the full
+    snapshot is published as ``audio_stats``.
+    """
+
+    def __init__(self, event_bus: EventBus | None = None, mode: str = "",
+                 path: str | None = "logs/turns.jsonl",
+                 max_bytes: int = 5_000_000, backup_count: int = 3,
+                 audio_stats: Callable[[], dict[str, dict]] | None = None):
+        self._event_bus = event_bus
+        self._mode = mode
+        self._audio_stats = audio_stats
+        self._last_audio: dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._spans: dict[str, list[float]] = {}
+        self._file_logger: logging.Logger | None = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._file_logger = logging.getLogger(f"echovault.trace.{path}")
+            self._file_logger.propagate = False
+            self._file_logger.setLevel(logging.INFO)
+            if not self._file_logger.handlers:
+                handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count)
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                self._file_logger.addHandler(handler)
+
+    def start_turn(self) -> TurnTrace:
+        return TurnTrace(next(self._ids), self._mode)
+
+    def finish(self, trace: TurnTrace):
+        record = trace.to_dict()
+        for name, ms in trace.spans().items():
+            self._spans.setdefault(name, []).append(ms)
+        if self._audio_stats:
+            snapshot = self._audio_stats()
+            record["audio"] = self._audio_delta(snapshot)
+            if self._event_bus:
+                self._event_bus.emit("audio_stats", snapshot)
+        if self._event_bus:
+            self._event_bus.emit("turn_trace", record)
+        if self._file_logger:
+            self._file_logger.info(json.dumps(record))
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """p50/p95 (ms) and sample count for every span seen so far."""
+        return {
+            name: {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+            }
+            for name, values in self._spans.items()
+        }
+
+    def log_summary(self):
+        summary = self.summary()
+        if summary:
+            lines = [f"{'span':<26}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}"]
+            for name in SPANS:
+                if name in summary:
+                    s = summary[name]
+                    lines.append(f"{name:<26}{s['count']:>5}{s['p50']:>10.0f}{s['p95']:>10.0f}")
+            logger.info("Turn latency summary:\n" + "\n".join(lines))
+
+        if self._audio_stats:
+            lines = [f"{'stream':<14}{'overflow':>9}{'underflow':>10}{'short':>7}{'timeout':>8}"
+                     f"{'underrun':>9}{'dropped':>9}{'rate':>9}{'max gap ms':>11}"]
+            for name, s in self._audio_stats().items():
+                rate = f"{s['rate_ratio']:.3f}" if s["rate_ratio"] is not None else "-"
+                lines.append(
+                    f"{name:<14}{s['overflows']:>9}{s['underflows']:>10}{s['short_reads']:>7}"
+                    f"{s['timeouts']:>8}{s['underruns']:>9}{s['dropped']:>9}{rate:>9}"
+                    f"{s['latency']['max_ms']:>11.0f}"
+                )
+            logger.info("Audio stream summary:\n" + "\n".join(lines))
+
+    def _audio_delta(self, snapshot: dict[str, dict]) -> dict[str, dict]:
+        delta = {}
+        for name, stats in snapshot.items():
+            previous = self._last_audio.get(name, {})
+            delta[name] = {key: stats[key] - previous.get(key, 0) for key in _AUDIO_COUNTERS}
+            delta[name]["rate_ratio"] = stats["rate_ratio"]
+        self._last_audio = snapshot
+        return delta
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+import numpy as np
+
+
+class BaseVAD(ABC):
+    @abstractmethod
+    def is_speech(self, frame: np.ndarray) -> bool:
+        """Classify one int16 frame. Engines may keep state between calls."""
+        ...
+
+    def process(self, frames: Iterable[np.ndarray]) -> list[bool]:
+        """Classify consecutive frames in one call. Loops over is_speech by default."""
+        return [self.is_speech(frame) for frame in frames]
+
+    def reset(self) -> None:
+        """Forget state carried between frames, e.g. at the start of a recording."""
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import onnxruntime as ort
+
+from src.utils.logger import setup_logger
+from src.vad.base import BaseVAD
+
+logger = setup_logger(__name__)
+
+# Window and look-back context (samples) the Silero v5 model expects per rate.
+_WINDOWS = {16000: (512, 64), 8000: (256, 32)}
+
+
+class SileroVAD(BaseVAD):
+    """Silero-style neural VAD run through onnxruntime.
+
+    The model scores fixed 32 ms windows (512 samples at 16 kHz) and carries
+    an LSTM state from one window to the next, so incoming frames of any
+    length are accumulated and every complete window is scored in order.
+    Samples are converted to float once per call, the input, context and
+    state tensors are preallocated, and ``process`` scores a whole run of
+    frames in one call. A frame's result is the speech decision after the
+    last window it completed.
+
+    Decisions use hysteresis: speech starts at ``threshold`` and ends when
+    the probability drops below ``threshold - 0.15``.
+    """
+
+    def __init__(self, model_path: str = "models/silero_vad.onnx",
+                 sample_rate: int = 16000, threshold: float = 0.5):
+        if sample_rate not in _WINDOWS:
+            raise ValueError(f"Silero VAD supports 8000 or 16000 Hz, not {sample_rate}")
+        self._window, self._context = _WINDOWS[sample_rate]
+        self._threshold = threshold
+        self._neg_threshold = max(threshold - 0.15, 0.01)
+
+        options = ort.SessionOptions()
+        # Single-threaded: a 32 ms window is too small to benefit from more.
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        logger.info(f"Loading Silero VAD from {model_path}...")
+        self._session = ort.InferenceSession(model_path, sess_options=options,
+                                             providers=["CPUExecutionProvider"])
+
+        self._sr = np.array(sample_rate, dtype=np.int64)
+        self._input = np.zeros((1, self._context + self._window), dtype=np.float32)
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._pending = 0
+        self._speaking = False
+        self.probability = 0.0
+
+    def reset(self) -> None:
+        self._input[:] = 0
+        self._state[:] = 0
+        self._pending = 0
+        self._speaking = False
+        self.probability = 0.0
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        return self.process((frame,))[0]
+
+    def process(self, frames: Iterable[np.ndarray]) -> list[bool]:
+        frames = list(frames)
+        if not frames:
+            return []
+        audio = np.concatenate(frames).astype(np.float32)
+        audio *= 1 / 32768
+        results = []
+        position = 0
+        for end in np.cumsum([len(frame) for frame in frames]):
+            while position < end:
+                offset = self._context + self._pending
+                take = min(self._window - self._pending, end - position)
+                self._input[0, offset:offset + take] = audio[position:position + take]
+                self._pending += take
+                position += take
+                if self._pending == self._window:
+                    self._score()
+            results.append(self._speaking)
+        return results
+
+    def _score(self):
+        output, self._state = self._session.run(
+            None, {"input": self._input, "state": self._state, "sr": self._sr}
+        )
+        self.probability = float(output[0, 0])
+        if self.probability >= self._threshold:
+            self._speaking = True
+        elif self.probability < self._neg_threshold:
+            self._speaking = False
+        # The tail of this window is the next window's context.
+        self._input[0, :self._context] = self._input[0, -self._context:]
+        self._pending = 0
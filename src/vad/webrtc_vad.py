@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import numpy as np
+import webrtcvad
+
+from src.vad.base import BaseVAD
+
+
+class WebRTCVAD(BaseVAD):
+    """The WebRTC GMM voice detector. Frames must be 10, 20 or 30 ms long."""
+
+    def __init__(self, sample_rate: int = 16000, aggressiveness: int = 2):
+        self._sample_rate = sample_rate
+        self._vad = webrtcvad.Vad(aggressiveness)
+
+    def is_speech(self, frame: np.ndarray) -> bool:
+        # webrtcvad wants a bytes-like buffer; len() of the array counts samples.
+        return self._vad.is_speech(memoryview(frame).cast("B"), self._sample_rate)
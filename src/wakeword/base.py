@@ -6,11 +6,15 @@ from typing import Callable
 
 class BaseWakeWord(ABC):
     @abstractmethod
-    def listen(self, callback: Callable[[], None]):
-        """Start listening for wake word. Call callback when detected."""
+    def listen(self, callback: Callable[[int], None]):
+        """Start listening for wake word. Call callback with the capture
+        position where the command following the wake word begins."""
         ...
 
     @abstractmethod
     def stop(self):
         """Stop listening."""
         ...
+
+    def warmup(self) -> None:
+        """Run a short synthetic input to initialize lazy state. No-op by default."""
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import threading
+from collections import deque
 from typing import Callable
 
 import numpy as np
-import pyaudio
 from openwakeword.model import Model
 from openwakeword.utils import download_models
 
+from src.audio.capture import CaptureService
+from src.audio.energy_gate import EnergyGate
 from src.wakeword.base import BaseWakeWord
 from src.utils.logger import setup_logger
 
@@ -15,38 +17,57 @@ logger = setup_logger(__name__)
 
 
 class OpenWakeWordDetector(BaseWakeWord):
-    def __init__(self, model_name: str = "hey_jarvis", threshold: float = 0.5,
-                 chunk_size: int = 1280, sample_rate: int = 16000):
+    def __init__(self, capture: CaptureService, model_name: str = "hey_jarvis",
+                 threshold: float = 0.5, chunk_size: int = 1280,
+                 preroll_ms: int = 0, gate: EnergyGate | None = None,
+                 lookback_chunks: int = 2):
+        self._capture = capture
         self._model_name = model_name
         self._threshold = threshold
         self._chunk_size = chunk_size
-        self._sample_rate = sample_rate
+        self._preroll = int(capture.sample_rate * preroll_ms / 1000)
+        self._gate = gate
+        self._lookback_chunks = lookback_chunks
         self._stop_event = threading.Event()
-        self._pa = pyaudio.PyAudio()
 
         logger.info(f"Loading OpenWakeWord model '{model_name}'...")
         download_models(model_names=[model_name])
         self._model = Model(wakeword_models=[model_name], inference_framework="onnx")
         logger.info("OpenWakeWord model loaded.")
 
-    def listen(self, callback: Callable[[], None]):
-        """Listen for wake word in a blocking loop. Calls callback on detection."""
-        self._stop_event.clear()
+    def listen(self, callback: Callable[[int], None]):
+        """Listen for wake word in a blocking loop. Calls callback on detection.
+
+        The callback receives the capture position just after the detection
+        frame, so a command spoken in the same breath as the wake word is
+        recorded from the shared ring. ``preroll_ms`` rewinds that position;
+        detection fires as the wake word ends, so the default of 0 keeps its
+        tail out of the recording.
 
-        stream = self._pa.open(
-            format=pyaudio.paInt16,
-            channels=1,
-            rate=self._sample_rate,
-            input=True,
-            frames_per_buffer=self._chunk_size,
-        )
+        Chunks the energy gate calls silent skip inference. The last few
+        skipped chunks are fed to the model once the gate opens, so the onset
+        of the wake word is scored with its real lead-in rather than stale
+        features.
+        """
+        self._stop_event.clear()
+        cursor = self._capture.cursor(name="wakeword")
+        skipped: deque[np.ndarray] = deque(maxlen=self._lookback_chunks)
 
         logger.info(f"Listening for wake word '{self._model_name}'...")
 
         try:
             while not self._stop_event.is_set():
-                data = stream.read(self._chunk_size, exception_on_overflow=False)
-                audio = np.frombuffer(data, dtype=np.int16)
+                audio = cursor.read(self._chunk_size, timeout=0.5)
+                if audio is None:
+                    if not self._capture.running:
+                        break
+                    continue
+
+                if self._gate is not None and self._gate.is_silent(audio):
+                    skipped.append(audio)
+                    continue
+                while skipped:
+                    self._model.predict(skipped.popleft())
 
                 prediction = self._model.predict(audio)
 
@@ -54,17 +75,25 @@ class OpenWakeWordDetector(BaseWakeWord):
                     if score > self._threshold:
                         logger.info(f"Wake word detected! (score={score:.2f})")
                         self._model.reset()
-                        callback()
+                        callback(max(0, cursor.position - self._preroll))
+                        # Skip the audio consumed by the conversation.
+                        cursor.seek_to_live()
+                        skipped.clear()
                         break
         except KeyboardInterrupt:
             pass
-        finally:
-            stream.stop_stream()
-            stream.close()
+
+        if self._gate is not None and self._gate.frames:
+            logger.info(f"Energy gate skipped {self._gate.skip_ratio:.0%} of wake word chunks.")
 
     def stop(self):
         self._stop_event.set()
 
+    def warmup(self) -> None:
+        silence = np.zeros(self._chunk_size, dtype=np.int16)
+        for _ in range(4):
+            self._model.predict(silence)
+        self._model.reset()
+
     def close(self):
         self.stop()
-        self._pa.terminate()